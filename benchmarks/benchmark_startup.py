@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# Copyright (c) 2020 The Regents of the University of Michigan
+# All rights reserved.
+# This software is licensed under the BSD 3-Clause License.
+"""Benchmark the import time of signac-flow and the start up time of the CLI.
+
+The benchmark measures the wall time of fresh interpreter processes for
+
+    1. importing the flow package,
+    2. showing the help of a minimal project module, and
+    3. executing a no-op operation for a single job with the `exec` command.
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import textwrap
+import timeit
+from tempfile import TemporaryDirectory
+
+import signac
+
+
+PROJECT_MODULE = textwrap.dedent("""
+    from flow import FlowProject
+
+
+    class Project(FlowProject):
+        pass
+
+
+    @Project.operation
+    def noop(job):
+        pass
+
+
+    if __name__ == '__main__':
+        Project().main()
+    """)
+
+
+def _time_command(cmd, cwd, num):
+    "Return the wall times of num subsequent executions of cmd."
+    def run():
+        subprocess.run(cmd, cwd=cwd, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    run()   # warm up file system and bytecode caches
+    return timeit.repeat(run, number=1, repeat=num)
+
+
+def main(args):
+    with TemporaryDirectory() as tmp_dir:
+        project = signac.init_project('benchmark-startup', root=tmp_dir)
+        job = project.open_job(dict(a=0)).init()
+        with open(os.path.join(tmp_dir, 'project.py'), 'w') as file:
+            file.write(PROJECT_MODULE)
+
+        benchmarks = [
+            ('import flow', [sys.executable, '-c', 'import flow']),
+            ('project.py --help', [sys.executable, 'project.py', '--help']),
+            ('project.py exec', [sys.executable, 'project.py', 'exec', 'noop', str(job)]),
+        ]
+        print("{:<20} {:>10} {:>10} {:>10}".format(
+            'benchmark', 'min [ms]', 'mean [ms]', 'max [ms]'))
+        for name, cmd in benchmarks:
+            times = [1e3 * t for t in _time_command(cmd, tmp_dir, args.num)]
+            print("{:<20} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+                name, min(times), statistics.mean(times), max(times)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-n', '--num',
+        type=int,
+        default=10,
+        help="The number of repetitions for each benchmark (default: %(default)s).")
+    main(parser.parse_args())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# Copyright (c) 2020 The Regents of the University of Michigan
+# All rights reserved.
+# This software is licensed under the BSD 3-Clause License.
+"""Benchmark the terminal rendering of large detailed status views.
+
+The benchmark renders the markdown of a detailed status view once with the
+tabulate-based terminal renderer and once with the fixed-width table renderer
+used by print_status and reports the wall times of both.
+"""
+import io
+import argparse
+import statistics
+import timeit
+from tempfile import TemporaryDirectory
+
+import signac
+from flow import FlowProject
+from flow.util import mistune
+from flow.render_status import _terminal_markdown
+
+
+class Project(FlowProject):
+    pass
+
+
+@Project.label
+def even(job):
+    return job.sp.i % 2 == 0
+
+
+@Project.operation
+@Project.post.isfile('a.txt')
+def op_a(job):
+    pass
+
+
+@Project.operation
+@Project.pre.after(op_a)
+def op_b(job):
+    pass
+
+
+def main(args):
+    with TemporaryDirectory() as tmp_dir:
+        signac.init_project('benchmark-status-render', root=tmp_dir)
+        project = Project.get_project(root=tmp_dir)
+        for i in range(args.num_jobs):
+            project.open_job(dict(i=i, name='job-{}'.format(i))).init()
+
+        status = io.StringIO()
+        project.print_status(detailed=True, all_ops=True, parameters=['i', 'name'],
+                             output_format='markdown', file=status, err=io.StringIO())
+        markdown = status.getvalue()
+        assert mistune.terminal(markdown) == _terminal_markdown()(markdown)
+
+        benchmarks = [
+            ('tabulate', mistune.terminal),
+            ('fixed-width', _terminal_markdown()),
+        ]
+        print("Rendering {} lines of markdown.".format(len(markdown.splitlines())))
+        print("{:<20} {:>10} {:>10} {:>10}".format(
+            'renderer', 'min [ms]', 'mean [ms]', 'max [ms]'))
+        for name, render in benchmarks:
+            times = [1e3 * t for t in timeit.repeat(
+                lambda: render(markdown), number=1, repeat=args.num)]
+            print("{:<20} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+                name, min(times), statistics.mean(times), max(times)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-N', '--num-jobs',
+        type=int,
+        default=5000,
+        help="The number of jobs in the status view (default: %(default)s).")
+    parser.add_argument(
+        '-n', '--num',
+        type=int,
+        default=5,
+        help="The number of repetitions for each benchmark (default: %(default)s).")
+    main(parser.parse_args())
@@ -24,6 +24,7 @@ from .operations import run
 from .environment import get_environment
 from .template import init
 from .util.misc import redirect_log
+from .util.instrumentation import collect_stats
 from .operations import with_job
 from .version import __version__
 
@@ -50,6 +51,7 @@ __all__ = [
     'get_environment',
     'init',
     'redirect_log',
+    'collect_stats',
     'with_job',
     '__version__',
     ]
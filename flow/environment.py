@@ -11,10 +11,14 @@ environment, e.g. for the adjustment of scheduler submission scripts.
 """
 import os
 import re
+import json
 import socket
+import time
 import logging
 import importlib
 from collections import OrderedDict
+from functools import lru_cache
+from hashlib import sha1
 import importlib.machinery
 import warnings
 
@@ -27,11 +31,99 @@ from .scheduling.torque import TorqueScheduler
 from .scheduling.simple_scheduler import SimpleScheduler
 from .scheduling.fakescheduler import FakeScheduler
 from .util import config as flow_config
+from .util.misc import _get_cache_directory
 from .errors import NoSchedulerError
 
 logger = logging.getLogger(__name__)
 
 
+# Schedulers whose presence is determined by launching one of their executables.
+_EXECUTABLE_SCHEDULER_TYPES = (LSFScheduler, SlurmScheduler, TorqueScheduler)
+
+# The presence of schedulers determined within this process.
+_SCHEDULER_PRESENCE = dict()
+
+# The time in seconds after which the absence of a scheduler is determined again, since
+# the detection may fail transiently, e.g., if a file system is temporarily unavailable.
+_SCHEDULER_ABSENCE_EXPIRY = 600
+
+
+@lru_cache(maxsize=1)
+def _get_fqdn():
+    "Return the fully qualified domain name of this host, which may require a DNS lookup."
+    return socket.getfqdn()
+
+
+def _get_scheduler_presence_cache():
+    """Return the file name of the persistent scheduler presence cache and its key.
+
+    The presence of a scheduler executable only depends on the host and the search
+    path, which is for example modified when loading environment modules.
+    """
+    cache_dir = _get_cache_directory()
+    if cache_dir is None or not flow_config.get_config_value('use_environment_cache', default=True):
+        return None, None
+    key = sha1(json.dumps([socket.gethostname(), os.environ.get('PATH', '')]).encode())
+    return os.path.join(cache_dir, 'schedulers.json'), key.hexdigest()
+
+
+def _read_scheduler_presence_cache(fn):
+    try:
+        with open(fn) as file:
+            return json.load(file)
+    except (IOError, OSError, ValueError):
+        return dict()
+
+
+def _write_scheduler_presence_cache(fn, cache):
+    # Replace the file atomically, since it may be shared by concurrent processes.
+    fn_tmp = '{}.{}.tmp'.format(fn, os.getpid())
+    try:
+        with open(fn_tmp, 'w') as file:
+            json.dump(cache, file)
+        os.replace(fn_tmp, fn)
+    except OSError as error:
+        logger.debug("Unable to write scheduler cache: {}".format(error))
+
+
+def _scheduler_is_present(scheduler_type):
+    """Determine whether the scheduler is present within the environment.
+
+    Checking for the schedulers that are detected by their executables, e.g., with
+    ``sbatch --version``, requires launching a subprocess. Their presence is therefore
+    cached for the present process and persistently for the host and search path.
+    The absence of a scheduler is only cached persistently for a limited time.
+    """
+    if not issubclass(scheduler_type, _EXECUTABLE_SCHEDULER_TYPES):
+        return scheduler_type.is_present()
+    if scheduler_type not in _SCHEDULER_PRESENCE:
+        name = scheduler_type.__name__
+        fn_cache, key = _get_scheduler_presence_cache()
+        cache = dict() if fn_cache is None else _read_scheduler_presence_cache(fn_cache)
+        entry = cache.get(key, dict()).get(name)
+        if isinstance(entry, dict) and (
+                entry.get('present') or
+                time.time() - entry.get('time', 0) < _SCHEDULER_ABSENCE_EXPIRY):
+            present = bool(entry.get('present'))
+        else:
+            present = bool(scheduler_type.is_present())
+            if fn_cache is not None:
+                cache.setdefault(key, dict())[name] = {'present': present, 'time': time.time()}
+                _write_scheduler_presence_cache(fn_cache, cache)
+        _SCHEDULER_PRESENCE[scheduler_type] = present
+    return _SCHEDULER_PRESENCE[scheduler_type]
+
+
+def _clear_scheduler_presence_cache():
+    "Clear the cached presence of schedulers for the present host and search path."
+    _SCHEDULER_PRESENCE.clear()
+    fn_cache, key = _get_scheduler_presence_cache()
+    if fn_cache is not None:
+        cache = _read_scheduler_presence_cache(fn_cache)
+        if cache.pop(key, None) is not None:
+            _write_scheduler_presence_cache(fn_cache, cache)
+
+
 def setup(py_modules, **attrs):
     """Setup function for environment modules.
 
@@ -119,10 +211,10 @@ class ComputeEnvironment(metaclass=ComputeEnvironmentType):
             if cls.scheduler_type is None:
                 return False
             else:
-                return cls.scheduler_type.is_present()
+                return _scheduler_is_present(cls.scheduler_type)
         else:
             return re.match(
-                cls.hostname_pattern, socket.getfqdn()) is not None
+                cls.hostname_pattern, _get_fqdn()) is not None
 
     @classmethod
     def get_scheduler(cls):
@@ -427,7 +519,7 @@ def registered_environments(import_configured=True):
     return list(ComputeEnvironment.registry.values())
 
 
-def get_environment(test=False, import_configured=True):
+def get_environment(test=False, import_configured=True, refresh=False):
     """Attempt to detect the present environment.
 
     This function iterates through all defined :py:class:`~.ComputeEnvironment`
@@ -435,13 +527,24 @@ def get_environment(test=False, import_configured=True):
     environment where the :py:meth:`~.ComputeEnvironment.is_present` method
     returns True.
 
+    The presence of schedulers that is determined by launching their executables
+    is cached for the host and the executable search path, unless the
+    ``use_environment_cache`` configuration option is disabled.
+
     :param test:
         Whether to return the TestEnvironment.
     :type test:
         bool
+    :param refresh:
+        Whether to clear the cached scheduler presence for the present host prior
+        to the detection.
+    :type refresh:
+        bool
     :returns:
         The detected environment class.
     """
+    if refresh:
+        _clear_scheduler_presence_cache()
     if test:
         return TestEnvironment
     else:
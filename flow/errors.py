@@ -2,9 +2,7 @@
 # All rights reserved.
 # This software is licensed under the BSD 3-Clause License.
 """Definitions of Exception classes used in this package."""
-
-import jinja2
-from jinja2.ext import Extension as Jinja2Extension
+import sys
 
 
 class ConfigKeyError(KeyError):
@@ -32,16 +30,36 @@ class UserOperationError(RuntimeError):
     pass
 
 
-class TemplateError(Jinja2Extension):
-    """Indicates errors in jinja2 templates"""
-    # ref:http://jinja.pocoo.org/docs/2.10/extensions/#jinja-extensions
-    tags = set(['raise'])
+def _define_template_error():
+    "Define the TemplateError extension, which requires the jinja2 package."
+    import jinja2
+    from jinja2.ext import Extension as Jinja2Extension
+
+    class TemplateError(Jinja2Extension):
+        """Indicates errors in jinja2 templates"""
+        # ref:http://jinja.pocoo.org/docs/2.10/extensions/#jinja-extensions
+        tags = set(['raise'])
+
+        def parse(self, parser):
+            lineno = next(parser.stream).lineno
+            args = [parser.parse_expression()]
+            return jinja2.nodes.CallBlock(
+                self.call_method('err', args), [], [], []).set_lineno(lineno)
+
+        def err(self, msg, caller):
+            raise jinja2.TemplateError(msg)
+
+    TemplateError.__module__ = __name__
+    TemplateError.__qualname__ = 'TemplateError'
+    return TemplateError
 
-    def parse(self, parser):
-        lineno = next(parser.stream).lineno
-        args = [parser.parse_expression()]
-        return jinja2.nodes.CallBlock(
-            self.call_method('err', args), [], [], []).set_lineno(lineno)
 
-    def err(self, msg, caller):
-        raise jinja2.TemplateError(msg)
+if sys.version_info < (3, 7):
+    TemplateError = _define_template_error()
+else:
+    def __getattr__(name):
+        # The jinja2 package is only imported once the extension is accessed.
+        if name == 'TemplateError':
+            globals()[name] = _define_template_error()
+            return globals()[name]
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
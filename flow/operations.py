@@ -13,7 +13,6 @@ import inspect
 import subprocess
 from multiprocessing import Pool
 from functools import wraps
-from tqdm import tqdm
 
 from signac import get_project
 
@@ -253,6 +252,8 @@ def run(parser=None):
     else:
         operation = operation_func
 
+    from tqdm import tqdm
+
     # Serial execution
     if args.np == 1 or len(jobs) < 2:
         if args.timeout is not None:
@@ -24,21 +24,20 @@ from deprecation import deprecated
 from collections import defaultdict
 from collections import OrderedDict
 from collections import Counter
+from collections.abc import Mapping
+from collections.abc import MutableMapping
 from copy import deepcopy
 from itertools import islice
 from itertools import count
 from itertools import groupby
 from hashlib import sha1
+from types import CodeType
 import multiprocessing
 import threading
 from multiprocessing import Pool
 from multiprocessing import cpu_count
 from multiprocessing import TimeoutError
-from multiprocessing.pool import ThreadPool
 from multiprocessing import Event
-import jinja2
-from jinja2 import TemplateNotFound as Jinja2TemplateNotFound
-from tqdm import tqdm
 
 import signac
 from signac.contrib.hashing import calc_id
@@ -56,14 +55,14 @@ from .errors import ConfigKeyError
 from .errors import NoSchedulerError
 from .errors import UserConditionError
 from .errors import UserOperationError
-from .errors import TemplateError
 from .util.misc import _positive_int
+from .util.misc import _nonnegative_int
+from .util.misc import _get_cache_directory
 from .util.misc import roundrobin
 from .util.misc import to_hashable
 from .util import template_filters as tf
 from .util.misc import add_cwd_to_environment_pythonpath
 from .util.misc import switch_to_directory
-from .util.misc import TrackGetItemDict
 from .util.translate import abbreviate
 from .util.translate import shorten
 from .labels import label
@@ -71,7 +70,7 @@ from .labels import staticlabel
 from .labels import classlabel
 from .labels import _is_label_func
 from .util import config as flow_config
-from .render_status import Renderer as StatusRenderer
+from .util import instrumentation
 from .version import __version__
 
 
@@ -149,6 +148,35 @@ class _IgnoreConditionsConversion(argparse.Action):
         setattr(namespace, self.dest, getattr(IgnoreConditions, values.upper()))
 
 
+def _get_code_tag(code):
+    "Return a hashable representation of a code object that ignores its location."
+    consts = tuple(_get_code_tag(c) if isinstance(c, CodeType) else c for c in code.co_consts)
+    return (code.co_code, consts, code.co_names)
+
+
+def _get_condition_tag(condition):
+    """Return the tag that identifies a condition function during graph detection.
+
+    Functions are considered to be equal if their bytecode, constants, referenced
+    names, and the contents of their closures are equal.
+
+    :raises: AttributeError
+        If the condition has no ``__code__`` attribute.
+    """
+    tag = _get_code_tag(condition.__code__)
+    closure = []
+    for cell in condition.__closure__ or ():
+        try:
+            value = to_hashable(cell.cell_contents)
+            hash(value)
+        except ValueError:      # empty cell
+            value = None
+        except TypeError:       # unhashable contents are compared by identity
+            value = (type(value), id(cell.cell_contents))
+        closure.append(value)
+    return tag + (tuple(closure),)
+
+
 class _condition(object):
     # This counter should be incremented each time a "never" condition
     # is created, and the value should be used as the tag for that
@@ -161,7 +189,7 @@ class _condition(object):
 
         if tag is None:
             try:
-                tag = condition.__code__.co_code
+                tag = _get_condition_tag(condition)
             except AttributeError:
                 logger.warning("Condition {} could not autogenerate tag.".format(condition))
         condition._flow_tag = tag
@@ -194,7 +222,7 @@ class _condition(object):
     def not_(cls, condition):
         "Returns ``not condition(job)`` for the provided condition function."
         return cls(lambda job: not condition(job),
-                   'not_'.encode() + condition.__code__.co_code)
+                   ('not_', _get_condition_tag(condition)))
 
 
 def _create_all_metacondition(condition_dict, *other_funcs):
@@ -210,6 +238,116 @@ def _create_all_metacondition(condition_dict, *other_funcs):
     return _flow_metacondition
 
 
+def _get_nested(key, mapping):
+    "Return the value of a dot-separated key of a nested mapping or None if it is missing."
+    for k in key.split('.'):
+        if mapping is None:
+            return
+        mapping = mapping.get(k)
+    return mapping
+
+
+def _parameter_sort_key(value):
+    "Return a key to sort parameter values of possibly mixed types."
+    if isinstance(value, (int, float)):
+        return (False, False, value, '')
+    return (value is None, True, 0, str(value))
+
+
+def _get_exported_status_hashes(collection, job_ids):
+    "Return the status hashes of the documents of the given jobs within collection."
+    if hasattr(collection, 'bulk_write'):
+        docs = collection.find({'_id': {'$in': job_ids}}, {'_status_hash': True})
+    elif isinstance(collection, signac.Collection):
+        docs = (collection[_id] for _id in job_ids if _id in collection)
+    else:
+        docs = filter(None, (collection.find_one({'_id': _id}) for _id in job_ids))
+    return {doc['_id']: doc.get('_status_hash') for doc in docs}
+
+
+def _get_varying_keys(statepoints):
+    """Return the sorted top-level keys with more than one value across all state points.
+
+    A key that is missing from a state point is considered to have the value None.
+    """
+    values = defaultdict(set)
+    counts = Counter()
+    num_statepoints = 0
+    for statepoint in statepoints:
+        num_statepoints += 1
+        for key, value in statepoint.items():
+            values[key].add(to_hashable(value))
+            counts[key] += 1
+    for key, n in counts.items():
+        if n < num_statepoints:
+            values[key].add(None)
+    return sorted(key for key, value in values.items() if len(value) > 1)
+
+
+def _apply_ignored_conditions(conditions, ignore_conditions):
+    """Return the evaluated conditions of an operation, accounting for ignored conditions.
+
+    :param conditions:
+        The tuple returned by :meth:`BaseFlowOperation._evaluate_conditions`.
+    :type conditions:
+        tuple
+    :param ignore_conditions:
+        The conditions that are ignored.
+    :type ignore_conditions:
+        :py:class:`~.IgnoreConditions`
+    :return:
+        Whether all pre-conditions are met and whether at least one post-condition
+        is unmet, where ignored conditions are considered to be satisfied.
+    :rtype:
+        tuple
+    """
+    pre, post = conditions
+    return (pre or bool(ignore_conditions & IgnoreConditions.PRE),
+            post or bool(ignore_conditions & IgnoreConditions.POST))
+
+
+def _bind_label_function(project, label_func):
+    """Return the label function as a callable that only takes the job as argument.
+
+    Label functions that require two positional arguments are expected to be called
+    with the project and the job, all other label functions with the job only.
+    """
+    try:
+        parameters = inspect.signature(label_func).parameters.values()
+    except (TypeError, ValueError):     # no signature available
+        return label_func
+    positional = [p for p in parameters
+                  if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+                  and p.default is p.empty]
+    if len(positional) == 2:
+        return functools.partial(label_func, project)
+    return label_func
+
+
+def _memoize_labels(method):
+    "Evaluate the labels of each job at most once per call of the decorated method."
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._memoized_labels():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _get_condition_name(condition):
+    "Return the name of a condition function as shown in the instrumentation statistics."
+    tag = getattr(condition, '_flow_tag', None)
+    if isinstance(tag, str):
+        return tag
+    composed_of = getattr(condition, '_composed_of', None)
+    if composed_of is not None:
+        return 'all({})'.format(', '.join(map(_get_condition_name, composed_of)))
+    name = getattr(condition, '__qualname__', None) or repr(condition)
+    code = getattr(condition, '__code__', None)
+    if code is not None:
+        name = '{}@{}:{}'.format(name, os.path.basename(code.co_filename), code.co_firstlineno)
+    return name
+
+
 def _make_bundles(operations, size=None):
     """Utility function for the generation of bundles.
 
@@ -253,16 +391,21 @@ class _JobOperation(object):
         :py:class:`signac.Job`.
     :param cmd:
         The command that executes this operation. Can be a function that when
-        evaluated returns a string.
+        evaluated returns a string. The function is evaluated once, when the
+        command is first accessed.
     :type cmd:
         callable or str
     :param directives:
         A dictionary of additional parameters that provide instructions on how
         to execute this operation, e.g., specifically required resources.
+        Can be a function with no arguments that returns the dictionary, which
+        is evaluated once, when the directives are first accessed.
     :type directives:
-        :class:`dict`
+        :class:`dict` or callable
     """
 
+    __slots__ = ('_id', 'name', 'job', '_cmd', '_directives')
+
     def __init__(self, id, name, job, cmd, directives=None):
         self._id = id
         self.name = name
@@ -273,22 +416,9 @@ class _JobOperation(object):
 
         if directives is None:
             directives = dict()  # default argument
-        else:
+        elif not callable(directives):
             directives = dict(directives)  # explicit copy
-
-        # Keys which were explicitly set by the user, but are not evaluated by the
-        # template engine are cause for concern and might hint at a bug in the template
-        # script or ill-defined directives. We are therefore keeping track of all
-        # keys set by the user and check whether they have been evaluated by the template
-        # script engine later.
-        keys_set_by_user = set(directives)
-
-        # We use a special dictionary that allows us to track all keys that have been
-        # evaluated by the template engine and compare them to those explicitly set
-        # by the user. See also comment above.
-        self.directives = TrackGetItemDict(
-            {key: value for key, value in directives.items()})
-        self.directives._keys_set_by_user = keys_set_by_user
+        self._directives = directives
 
     def __str__(self):
         return "{}({})".format(self.name, self.job)
@@ -320,9 +450,14 @@ class _JobOperation(object):
             # If we need to fork this will fail to generate a command and
             # error, but not until then. If we don't fork then nothing errors,
             # and the user gets the expected result.
-            return self._cmd()
-        else:
-            return self._cmd
+            self._cmd = self._cmd()
+        return self._cmd
+
+    @property
+    def directives(self):
+        if callable(self._directives):
+            self._directives = self._directives()
+        return self._directives
 
     def set_status(self, value):
         "Store the operation's status."
@@ -331,11 +466,86 @@ class _JobOperation(object):
     def get_status(self):
         "Retrieve the operation's last known status."
         try:
-            return JobStatus(self.job._project.document['_status'][self.id])
+            with instrumentation._timer('document_reads', '_status'):
+                return JobStatus(self.job._project.document['_status'][self.id])
         except KeyError:
             return JobStatus.unknown
 
 
+class _TrackedDirectives(MutableMapping):
+    """A view of the directives of an operation that keeps track of the accessed keys.
+
+    Unlike a copy, the view does not evaluate directives that are never accessed.
+    Comparisons with other directives do not count as access.
+
+    :param directives:
+        The directives to track.
+    :type directives:
+        :class:`collections.abc.MutableMapping`
+    """
+
+    def __init__(self, directives):
+        self._directives = directives
+        self.keys_used = set()
+
+    def __getitem__(self, key):
+        self.keys_used.add(key)
+        return self._directives[key]
+
+    def __setitem__(self, key, value):
+        self._directives[key] = value
+
+    def __delitem__(self, key):
+        del self._directives[key]
+
+    def __iter__(self):
+        return iter(self._directives)
+
+    def __len__(self):
+        return len(self._directives)
+
+    def __contains__(self, key):
+        return key in self._directives
+
+    def __eq__(self, other):
+        if isinstance(other, _TrackedDirectives):
+            other = other._directives
+        return self._directives == other
+
+    def __repr__(self):
+        return repr(self._directives)
+
+
+@contextlib.contextmanager
+def _track_directives_usage(operations):
+    """Track which directives of the given operations are accessed within this context.
+
+    Keys which were explicitly set by the user, but are not evaluated by the
+    template engine are cause for concern and might hint at a bug in the template
+    script or ill-defined directives. Within this context, the directives of all
+    operations are replaced by a view that keeps track of all keys that have been
+    accessed, without evaluating any directives.
+
+    :param operations:
+        The operations to track.
+    :type operations:
+        Sequence of instances of :class:`._JobOperation`
+    :yields:
+        A set, which contains all keys that were set, but not accessed for at
+        least one operation, once the context is exited.
+    """
+    tracked = [(op, _TrackedDirectives(op.directives)) for op in operations]
+    for op, directives in tracked:
+        op._directives = directives
+    keys_unused = set()
+    try:
+        yield keys_unused
+    finally:
+        for op, directives in tracked:
+            keys_unused.update(set(directives).difference(directives.keys_used))
+            op._directives = directives._directives
+
+
 @deprecated(
     deprecated_in="0.11", removed_in="0.13", current_version=__version__)
 class JobOperation(_JobOperation):
@@ -373,6 +583,9 @@ class _SubmissionJobOperation(_JobOperation):
         Passed to the constructor of :py:class:`_JobOperation`.
     """
 
+    __slots__ = ('eligible_operations', 'operations_with_unmet_preconditions',
+                 'operations_with_met_postconditions')
+
     def __init__(
         self,
         *args,
@@ -399,6 +612,148 @@ class _SubmissionJobOperation(_JobOperation):
             self.operations_with_met_postconditions = operations_with_met_postconditions
 
 
+class _CollapsedDirectives(Mapping):
+    """The directives of submission operations that are executed with one command.
+
+    The directives of collapsed operations are equal. Accessing a directive accesses
+    it for all operations, such that its usage is tracked for each of them.
+
+    :param operations:
+        The collapsed submission operations.
+    :type operations:
+        list
+    """
+
+    def __init__(self, operations):
+        self._operations = operations
+
+    def __getitem__(self, key):
+        values = [op.directives[key] for op in self._operations]
+        return values[0]
+
+    def __iter__(self):
+        return iter(self._operations[0].directives)
+
+    def __len__(self):
+        return len(self._operations[0].directives)
+
+    def __contains__(self, key):
+        return key in self._operations[0].directives
+
+    def __repr__(self):
+        return repr(self._operations[0].directives)
+
+
+class _CollapsedSubmissionJobOperation(object):
+    """This class represents the submission of one group for multiple jobs.
+
+    The submission operations are executed for all jobs with one command and
+    therefore within one interpreter. This class provides the same interface to
+    the templates as the :py:class:`_SubmissionJobOperation` class.
+
+    :param operations:
+        The submission operations of the same group with equal directives.
+    :type operations:
+        list
+    :param cmd:
+        The command that executes the group for the jobs of all operations.
+    :type cmd:
+        str
+    """
+
+    __slots__ = ('operations', 'cmd')
+
+    def __init__(self, operations, cmd):
+        self.operations = operations
+        self.cmd = cmd
+
+    def __str__(self):
+        return "{}({})".format(self.name, ', '.join(str(op.job) for op in self.operations))
+
+    @property
+    def name(self):
+        return self.operations[0].name
+
+    @property
+    def directives(self):
+        return _CollapsedDirectives(self.operations)
+
+    @property
+    def eligible_operations(self):
+        return [op for sop in self.operations for op in sop.eligible_operations]
+
+    @property
+    def operations_with_unmet_preconditions(self):
+        return [op for sop in self.operations for op in sop.operations_with_unmet_preconditions]
+
+    @property
+    def operations_with_met_postconditions(self):
+        return [op for sop in self.operations for op in sop.operations_with_met_postconditions]
+
+
+def _collapse_operations(operations):
+    """Collapse the submission operations of the same group into one command for many jobs.
+
+    Operations are collapsed if their commands only differ by the job id and their
+    directives are equal. Operations that are forked or executed with MPI are never
+    collapsed. The order of execution of the operations of each job is preserved.
+
+    :param operations:
+        The submission operations to collapse.
+    :type operations:
+        Sequence of instances of :class:`._SubmissionJobOperation`
+    :return:
+        The operations, where operations that are executed with one command are
+        replaced by an instance of :class:`._CollapsedSubmissionJobOperation`.
+    :rtype:
+        list
+    """
+    entries = []
+    for i, op in enumerate(operations):
+        job_id = str(op.job)
+        prefix, sep, suffix = op.cmd.partition(' -j {}'.format(job_id))
+        collapsible = sep and not (op.directives.get('fork') or op.directives.get('nranks'))
+        key = (op.name, prefix, suffix) if collapsible else i
+        entries.append((key, job_id, prefix, suffix, op))
+
+    # The operations with the same command are made adjacent if that is consistent
+    # with the order of the operations of each job.
+    previous = dict()
+    edges = []
+    for key, job_id, _, _, _ in entries:
+        if job_id in previous:
+            edges.append((previous[job_id], key))
+        previous[job_id] = key
+    graph = _OperationGraph(OrderedDict.fromkeys(key for key, *_ in entries), edges)
+    if all(graph.rank[a] <= graph.rank[b] for a, b in edges):
+        entries.sort(key=lambda entry: graph.rank[entry[0]])
+
+    collapsed = []      # (prefix, suffix, operations) of each command
+    latest = dict()     # the index of the most recent command for each key
+    job_index = dict()  # the index of the command with the most recent operation of each job
+    for key, job_id, prefix, suffix, op in entries:
+        index = latest.get(key)
+        if index is not None and (index < job_index.get(job_id, -1) or
+                                  op.directives != collapsed[index][2][0].directives):
+            index = None
+        if index is None:
+            index = len(collapsed)
+            collapsed.append((prefix, suffix, []))
+            latest[key] = index
+        collapsed[index][2].append(op)
+        job_index[job_id] = index
+
+    result = []
+    for prefix, suffix, ops in collapsed:
+        if len(ops) == 1:
+            result.append(ops[0])
+        else:
+            job_ids = ' '.join(str(op.job) for op in ops)
+            result.append(_CollapsedSubmissionJobOperation(
+                ops, '{} -j {}{}'.format(prefix, job_ids, suffix)))
+    return result
+
+
 class _FlowCondition(object):
     """A _FlowCondition represents a condition as a function of a signac job.
 
@@ -414,10 +769,12 @@ class _FlowCondition(object):
 
     def __init__(self, callback):
         self._callback = callback
+        self._name = _get_condition_name(callback)
 
     def __call__(self, job):
         try:
-            return self._callback(job)
+            with instrumentation._timer('conditions', self._name):
+                return self._callback(job)
         except Exception as e:
             raise UserConditionError(
                 'An exception was raised while evaluating the condition {name} '
@@ -430,6 +787,197 @@ class _FlowCondition(object):
         return self._callback == other._callback
 
 
+class _OperationGraph(object):
+    """Sparse directed graph of operations defined by their pre- and post-conditions.
+
+    An edge from operation *a* to operation *b* exists if a post-condition of *a* is
+    also a pre-condition of *b*, that means *b* is downstream of *a*.
+
+    :param names:
+        The operation names in order of registration.
+    :type names:
+        list
+    :param edges:
+        The edges of the graph as tuples of operation names.
+    :type edges:
+        iterable
+    """
+
+    __slots__ = ('names', 'downstream', 'upstream', 'rank')
+
+    def __init__(self, names, edges):
+        self.names = list(names)
+        self.downstream = {name: set() for name in self.names}
+        self.upstream = {name: set() for name in self.names}
+        for a, b in edges:
+            self.downstream[a].add(b)
+            if a != b:
+                self.upstream[b].add(a)
+        self.rank = {name: i for i, name in enumerate(self._topological_order())}
+
+    def upstream_closure(self, name):
+        "Return the names of the operation and of all operations it transitively depends on."
+        closure = {name}
+        stack = [name]
+        while stack:
+            for a in self.upstream[stack.pop()]:
+                if a not in closure:
+                    closure.add(a)
+                    stack.append(a)
+        return closure
+
+    def _topological_order(self):
+        """Return the operation names in topological order.
+
+        Operations that are part of a cycle are appended in order of registration.
+        """
+        in_degree = {name: len(self.upstream[name]) for name in self.names}
+        ready = [name for name in self.names if not in_degree[name]]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for b in sorted(self.downstream[name] - {name}, key=self.names.index):
+                in_degree[b] -= 1
+                if not in_degree[b]:
+                    ready.append(b)
+        if len(order) < len(self.names):
+            ordered = set(order)
+            order.extend(name for name in self.names if name not in ordered)
+        return order
+
+
+class _LazyDirectives(MutableMapping):
+    """The directives of one operation for a specific job, evaluated on first access.
+
+    Job-dependent directives are only evaluated when they are accessed for the first
+    time and the result is cached, such that directives which are never used, e.g.,
+    by the submission template, are never evaluated.
+
+    :param static:
+        The directives that do not depend on the job.
+    :type static:
+        dict
+    :param dynamic:
+        The job-dependent directives as callables of the job.
+    :type dynamic:
+        dict
+    :param job:
+        The job to evaluate the directives for.
+    :type job:
+        :class:`signac.Job`
+    """
+
+    def __init__(self, static, dynamic, job):
+        self._values = dict(static)
+        self._pending = dict(dynamic)
+        self._job = job
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            func = self._pending.pop(key)   # raises KeyError for unknown keys
+            self._values[key] = value = func(self._job)
+            return value
+
+    def __setitem__(self, key, value):
+        self._pending.pop(key, None)
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        if self._pending.pop(key, None) is None:
+            del self._values[key]
+
+    def __iter__(self):
+        yield from self._values
+        yield from self._pending
+
+    def __len__(self):
+        return len(self._values) + len(self._pending)
+
+    def __contains__(self, key):
+        return key in self._values or key in self._pending
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class _DirectivesResolver(object):
+    """Resolve the directives of one operation for specific jobs.
+
+    The directives are compiled once into static values, which are shared by
+    all jobs, and job-dependent values, which are callables or format strings
+    that are evaluated for each job.
+
+    :param directives:
+        The directives as provided by the user.
+    :type directives:
+        dict
+    """
+
+    def __init__(self, directives):
+        directives = dict(directives)
+        nranks = directives.get('nranks', 1)
+        nthreads = directives.get('omp_num_threads', 1)
+        if callable(nranks) or callable(nthreads):
+            directives.setdefault('np', functools.partial(self._np, nranks, nthreads))
+        else:
+            directives.setdefault('np', nranks*nthreads)
+
+        directives.setdefault('ngpu', 0)
+        directives.setdefault('nranks', 0)
+        directives.setdefault('omp_num_threads', 0)
+        directives.setdefault('processor_fraction', 1)
+
+        self._static = dict()
+        self._dynamic = dict()
+        for key, value in directives.items():
+            if value and callable(value):
+                self._dynamic[key] = value
+            elif isinstance(value, str) and ('{' in value or '}' in value):
+                self._dynamic[key] = functools.partial(self._format, value)
+            else:
+                self._static[key] = value
+
+    @staticmethod
+    def _np(nranks, nthreads, job):
+        nr = nranks(job) if callable(nranks) else nranks
+        nt = nthreads(job) if callable(nthreads) else nthreads
+        return nr*nt
+
+    @staticmethod
+    def _format(value, job):
+        return value.format(job=job)
+
+    def __call__(self, job, keys=None):
+        """Evaluate the directives for job.
+
+        :param job:
+            The job to evaluate the directives for.
+        :type job:
+            :class:`signac.Job`
+        :param keys:
+            Only evaluate the directives with these keys. By default, all directives
+            are returned as a mapping that evaluates each directive on first access.
+        :type keys:
+            Iterable of str
+        :return:
+            The evaluated directives.
+        :rtype:
+            dict or :class:`_LazyDirectives`
+        """
+        if keys is None:
+            return _LazyDirectives(self._static, self._dynamic, job)
+        directives = dict()
+        for key in keys:
+            if key in self._dynamic:
+                directives[key] = self._dynamic[key](job)
+            elif key in self._static:
+                directives[key] = self._static[key]
+        return directives
+
+
 class BaseFlowOperation(object):
     """A BaseFlowOperation represents a data space operation, operating on any job.
 
@@ -501,6 +1049,22 @@ class BaseFlowOperation(object):
             post = True
         return pre and post
 
+    def _evaluate_conditions(self, job, ignore_conditions=IgnoreConditions.NONE):
+        """Evaluate the pre- and post-conditions of this operation exactly once.
+
+        :return:
+            A tuple of two booleans: whether all pre-conditions are met and whether at
+            least one post-condition is unmet, each accounting for ignored conditions.
+            The operation is eligible if and only if both are true.
+        :rtype:
+            tuple
+        """
+        pre = (not len(self._prereqs)) or bool(ignore_conditions & IgnoreConditions.PRE) \
+            or all(cond(job) for cond in self._prereqs)
+        post = (not len(self._postconds)) or bool(ignore_conditions & IgnoreConditions.POST) \
+            or any(not cond(job) for cond in self._postconds)
+        return pre, post
+
     def complete(self, job):
         "True when all post-conditions are met."
         if len(self._postconds):
@@ -699,6 +1263,8 @@ class FlowGroup(object):
             self.operation_directives = dict()
         else:
             self.operation_directives = operation_directives
+        # Compiled directives, see _get_directives_resolver().
+        self._directives_resolvers = dict()
 
     def _set_entrypoint_item(self, entrypoint, directives, key, default, job):
         """Set a value (executable, path) for entrypoint in command.
@@ -725,37 +1291,28 @@ class FlowGroup(object):
         self._set_entrypoint_item(entrypoint, directives, 'path', default_path, job)
         return "{} {}".format(entrypoint['executable'], entrypoint['path']).lstrip()
 
-    def _resolve_directives(self, name, defaults, job):
-        if name in self.operation_directives:
-            directives = deepcopy(self.operation_directives[name])
-        else:
-            directives = deepcopy(defaults.get(name, dict()))
-        nranks = directives.get('nranks', 1)
-        nthreads = directives.get('omp_num_threads', 1)
-        if callable(nranks) or callable(nthreads):
-            def np_callable(job):
-                nr = nranks(job) if callable(nranks) else nranks
-                nt = nthreads(job) if callable(nthreads) else nthreads
-                return nr*nt
+    def _get_directives_resolver(self, name, defaults):
+        """Return the compiled directives for operation name.
 
-            directives.setdefault('np', np_callable)
+        The compiled directives are cached and only recompiled when the
+        directives of the operation have been changed.
+        """
+        if name in self.operation_directives:
+            directives = self.operation_directives[name]
         else:
-            directives.setdefault('np', nranks*nthreads)
-
-        directives.setdefault('ngpu', 0)
-        directives.setdefault('nranks', 0)
-        directives.setdefault('omp_num_threads', 0)
-        directives.setdefault('processor_fraction', 1)
+            directives = defaults.get(name, dict())
+        try:
+            source, resolver = self._directives_resolvers[name]
+            if source == directives:
+                return resolver
+        except KeyError:
+            pass
+        resolver = _DirectivesResolver(directives)
+        self._directives_resolvers[name] = dict(directives), resolver
+        return resolver
 
-        # Evaluate strings and callables for job:
-        def evaluate(value):
-            if value and callable(value):
-                return value(job)
-            elif isinstance(value, str):
-                return value.format(job=job)
-            else:
-                return value
-        return {key: evaluate(value) for key, value in directives.items()}
+    def _resolve_directives(self, name, defaults, job, keys=None):
+        return self._get_directives_resolver(name, defaults)(job, keys)
 
     def _submit_cmd(self, entrypoint, ignore_conditions, job=None):
         entrypoint = self._determine_entrypoint(entrypoint, dict(), job)
@@ -805,6 +1362,26 @@ class FlowGroup(object):
         """
         return any(op.eligible(job, ignore_conditions) for op in self)
 
+    def _evaluate_conditions(self, job, ignore_conditions=IgnoreConditions.NONE):
+        """Evaluate the pre- and post-conditions of all operations exactly once.
+
+        :param job:
+            A :class:`signac.Job` from the signac workspace.
+        :type job:
+            :class:`signac.Job`
+        :param ignore_conditions:
+            The conditions that are not evaluated.
+        :type ignore_conditions:
+            :py:class:`~.IgnoreConditions`
+        :return:
+            A dict that maps the operation names to the tuples returned by
+            :meth:`BaseFlowOperation._evaluate_conditions`.
+        :rtype:
+            dict
+        """
+        return OrderedDict((name, op._evaluate_conditions(job, ignore_conditions))
+                           for name, op in self.operations.items())
+
     def complete(self, job):
         """True when all BaseFlowOperation post-conditions are met.
 
@@ -870,7 +1447,8 @@ class FlowGroup(object):
                                          op_string,
                                          index)
         # The job_op_id is a hash computed from the unique full name.
-        job_op_id = calc_id(full_name)
+        with instrumentation._timer('id_generations', self.name):
+            job_op_id = calc_id(full_name)
 
         # The actual job id is then constructed from a readable part and the job_op_id,
         # ensuring that the job-op is still somewhat identifiable, but guaranteed to
@@ -895,13 +1473,14 @@ class FlowGroup(object):
     def _get_status(self, job):
         """For a given job check the groups submission status."""
         try:
-            return JobStatus(job._project.document['_status'][self._generate_id(job)])
+            with instrumentation._timer('document_reads', '_status'):
+                return JobStatus(job._project.document['_status'][self._generate_id(job)])
         except KeyError:
             return JobStatus.unknown
 
     def _create_submission_job_operation(self, entrypoint, default_directives, job,
                                          ignore_conditions_on_execution=IgnoreConditions.NONE,
-                                         index=0):
+                                         index=0, conditions=None):
         """Create a _JobOperation object from the FlowGroup.
 
         Creates a _JobOperation for use in submitting and scripting.
@@ -934,6 +1513,12 @@ class FlowGroup(object):
             Index for the :class:`~._JobOperation`.
         :type index:
             int
+        :param conditions:
+            The conditions of the operations as returned by :meth:`~._evaluate_conditions`,
+            which must not ignore any conditions that are not ignored on execution. The
+            conditions are evaluated if None.
+        :type conditions:
+            dict
         :return:
             Returns a :py:class:`~._SubmissionJobOperation` for submitting the group. The
             :py:class:`~._JobOperation` will have directives that have been collected
@@ -944,26 +1529,33 @@ class FlowGroup(object):
         uneval_cmd = functools.partial(self._submit_cmd, entrypoint=entrypoint, job=job,
                                        ignore_conditions=ignore_conditions_on_execution)
 
-        def _get_run_ops(ignore_ops, additional_ignores_flag):
-            """Get operations that match the combination of the conditions required by
-            _create_submission_job_operation and the ignored flags, and remove operations
-            in the ignore_ops list."""
-            return list(
-                set(self._create_run_job_operations(
-                    entrypoint=entrypoint,
-                    default_directives=default_directives,
-                    job=job,
-                    ignore_conditions=ignore_conditions_on_execution | additional_ignores_flag)
-                    ) - set(ignore_ops)
-            )
-
+        # Every condition is evaluated at most once; an operation that is eligible when
+        # pre-conditions (post-conditions) are ignored has unmet pre-conditions (met
+        # post-conditions) unless it is eligible outright. The job operations are shared
+        # among the categories, so that directives and commands are resolved only once.
+        if conditions is None:
+            conditions = self._evaluate_conditions(job, ignore_conditions_on_execution)
+        eligible, eligible_ignoring_pre, eligible_ignoring_post = [], [], []
+        for name, op in self.operations.items():
+            pre, post = _apply_ignored_conditions(conditions[name], ignore_conditions_on_execution)
+            if not (pre or post):
+                continue
+            job_op = self._create_run_job_operation(
+                entrypoint, default_directives, job, name, op, index=0)
+            if pre and post:
+                eligible.append(job_op)
+            if post:
+                eligible_ignoring_pre.append(job_op)
+            if pre:
+                eligible_ignoring_post.append(job_op)
+
+        # The operations are listed in the order in which they were added to the group.
         submission_directives = self._get_submission_directives(default_directives, job)
-        eligible_operations = _get_run_ops(
-            [], IgnoreConditions.NONE)
-        operations_with_unmet_preconditions = _get_run_ops(
-            eligible_operations, IgnoreConditions.PRE)
-        operations_with_met_postconditions = _get_run_ops(
-            eligible_operations, IgnoreConditions.POST)
+        eligible_operations = list(dict.fromkeys(eligible))
+        operations_with_unmet_preconditions = [
+            op for op in dict.fromkeys(eligible_ignoring_pre) if op not in eligible]
+        operations_with_met_postconditions = [
+            op for op in dict.fromkeys(eligible_ignoring_post) if op not in eligible]
 
         submission_job_operation = _SubmissionJobOperation(
             self._generate_id(job, index=index),
@@ -1008,19 +1600,36 @@ class FlowGroup(object):
         """
         for name, op in self.operations.items():
             if op.eligible(job, ignore_conditions):
-                directives = self._resolve_directives(name, default_directives, job)
-                cmd = self._run_cmd(entrypoint=entrypoint, operation_name=name,
-                                    operation=op, directives=directives, job=job)
-                job_op = _JobOperation(self._generate_id(job, name, index=index), name, job,
-                                       cmd=cmd, directives=deepcopy(directives))
-                # Get the prefix, and if it's not NULL, set the fork directive
-                # to True since we must launch a separate process. Override
-                # the command directly.
-                prefix = job._project._environment.get_prefix(job_op)
-                if prefix != '':
-                    job_op.directives['fork'] = True
-                    job_op._cmd = '{} {}'.format(prefix, job_op.cmd)
-                yield job_op
+                yield self._create_run_job_operation(
+                    entrypoint, default_directives, job, name, op, index)
+
+    def _create_run_job_operation(self, entrypoint, default_directives, job, name,
+                                  operation, index):
+        """Create a _JobOperation for one contained operation.
+
+        The directives and the command of the returned _JobOperation are only
+        evaluated when they are first accessed.
+        """
+        resolver = self._get_directives_resolver(name, default_directives)
+        environment = job._project._environment
+
+        def get_directives():
+            job_op._directives = directives = resolver(job)
+            # If the prefix is not NULL, set the fork directive to True
+            # since we must launch a separate process.
+            if environment.get_prefix(job_op) != '':
+                directives['fork'] = True
+            return directives
+
+        def get_cmd():
+            cmd = self._run_cmd(entrypoint=entrypoint, operation_name=name,
+                                operation=operation, directives=job_op.directives, job=job)
+            prefix = environment.get_prefix(job_op)
+            return cmd if prefix == '' else '{} {}'.format(prefix, cmd)
+
+        job_op = _JobOperation(self._generate_id(job, name, index=index), name, job,
+                               cmd=get_cmd, directives=get_directives)
+        return job_op
 
     def _get_submission_directives(self, default_directives, job):
         """Get the combined resources for submission.
@@ -1032,7 +1641,8 @@ class FlowGroup(object):
 
         for name in self.operations:
             # get directives for operation
-            op_dir = self._resolve_directives(name, default_directives, job)
+            op_dir = self._resolve_directives(
+                name, default_directives, job, keys=list(directives))
             # Find the correct number of processors for operation
             directives['ngpu'] = max(directives['ngpu'], op_dir['ngpu'])
             directives['nranks'] = max(directives['nranks'], op_dir['nranks'])
@@ -1042,6 +1652,113 @@ class FlowGroup(object):
         return directives
 
 
+class _SchedulerStatusPoller(threading.Thread):
+    """Periodically query the scheduler for the status of a project's operations.
+
+    The poller runs in a background (daemon) thread and keeps the most recent
+    result of :meth:`FlowProject._query_scheduler_status` in memory. The
+    result is only written to the project document by the thread that owns
+    the project, see :meth:`FlowProject._publish_scheduler_status`.
+
+    .. note::
+
+        This class is used by :meth:`FlowProject.poll_scheduler_status` and
+        should not be instantiated by users themselves.
+
+    :param project:
+        The project whose operations' scheduler status is polled.
+    :type project:
+        :py:class:`FlowProject`
+    :param interval:
+        The time in seconds between two consecutive scheduler queries.
+    :type interval:
+        float
+    """
+
+    def __init__(self, project, interval):
+        super(_SchedulerStatusPoller, self).__init__(
+            name='SchedulerStatusPoller', daemon=True)
+        self._project = project
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._first_query_done = threading.Event()
+        self._timestamp = None
+        self._status = None
+
+    def run(self):
+        while not self._stop_event.is_set():
+            timestamp = time.time()
+            try:
+                status = self._project._query_scheduler_status()
+            except NoSchedulerError:
+                logger.debug("No scheduler available, stop polling.")
+                break
+            except RuntimeError as error:
+                logger.warning("Error occurred while polling scheduler: '{}'.".format(error))
+            else:
+                with self._lock:
+                    self._timestamp = timestamp
+                    self._status = status
+                logger.debug("Polled scheduler status.")
+            finally:
+                self._first_query_done.set()
+            self._stop_event.wait(self.interval)
+        self._first_query_done.set()
+
+    def snapshot(self):
+        """Return the time and result of the most recent successful scheduler query.
+
+        Blocks until the first query attempt is completed. Returns ``(None, None)`` if
+        no query has been successful so far.
+        """
+        self._first_query_done.wait()
+        with self._lock:
+            return self._timestamp, self._status
+
+    def stop(self):
+        "Stop polling and wait for the thread to finish."
+        self._stop_event.set()
+        self.join()
+
+
+# Template environments are shared among all project instances within one process,
+# so that each template is parsed and compiled at most once.
+_TEMPLATE_ENVIRONMENTS = dict()
+
+
+def _template_not_found_error():
+    """Return the exception type raised for missing templates.
+
+    The jinja2 package is only imported when a template environment is set up, so a
+    missing template can only have been encountered if the module is already loaded.
+    An empty tuple is returned otherwise, which matches no exception.
+    """
+    jinja2 = sys.modules.get('jinja2')
+    return () if jinja2 is None else jinja2.TemplateNotFound
+
+
+def _get_template_bytecode_cache():
+    """Return a persistent cache for the bytecode of compiled templates.
+
+    The cache is stored within the user's cache directory and is specific to the
+    installed version of signac-flow. Cached bytecode is invalidated whenever the
+    source of a template changes.
+
+    :return:
+        The bytecode cache or None if the cache directory is not writable.
+    :rtype:
+        :class:`jinja2.FileSystemBytecodeCache`
+    """
+    import jinja2
+
+    cache_dir = _get_cache_directory('templates')
+    if cache_dir is None:
+        return None
+    return jinja2.FileSystemBytecodeCache(
+        cache_dir, pattern='__signac_flow_{}_%s.cache'.format(__version__))
+
+
 class _FlowProjectClass(type):
     """Metaclass for the FlowProject class."""
     def __new__(metacls, name, bases, namespace, **kwargs):
@@ -1075,6 +1792,10 @@ class _FlowProjectClass(type):
         cls._GROUPS = list()
         cls._GROUP_NAMES = set()
 
+        # The operation graphs detected from the pre- and post-conditions, keyed by the
+        # registered operations and their conditions, see FlowProject._get_operation_graph().
+        cls._OPERATION_GRAPHS = dict()
+
         return cls
 
     @staticmethod
@@ -1098,7 +1819,8 @@ class _FlowProjectClass(type):
             An optional tag may be associated with the condition. These tags
             are used by :meth:`~.detect_operation_graph` when comparing
             conditions for equality. The tag defaults to the bytecode of the
-            function.
+            function together with its constants, the names it references, and
+            the contents of its closure.
             """
 
             _parent_class = parent_class
@@ -1153,7 +1875,8 @@ class _FlowProjectClass(type):
             An optional tag may be associated with the condition. These tags
             are used by :meth:`~.detect_operation_graph` when comparing
             conditions for equality. The tag defaults to the bytecode of the
-            function.
+            function together with its constants, the names it references, and
+            the contents of its closure.
             """
             _parent_class = parent_class
 
@@ -1211,8 +1934,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
     def __init__(self, config=None, environment=None, entrypoint=None):
         super(FlowProject, self).__init__(config=config)
 
-        # Associate this class with a compute environment.
-        self._environment = environment or get_environment()
+        # Associate this class with a compute environment. The environment is detected
+        # upon first access, since the detection may require launching subprocesses.
+        self._environment_ = environment
 
         # Assign variables that give script location information
         self._entrypoint = dict() if entrypoint is None else entrypoint
@@ -1227,6 +1951,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         # Register all label functions with this project instance.
         self._label_functions = OrderedDict()
         self._register_labels()
+        self._label_cache = None
+        self._label_timings = defaultdict(lambda: [0, 0.0])
+        self._label_timings_lock = threading.Lock()
 
         # Register all operation functions with this project instance.
         self._operations = OrderedDict()
@@ -1236,6 +1963,37 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         self._groups = dict()
         self._register_groups()
 
+        # The background scheduler status poller (if active) and the time stamp of
+        # the most recent scheduler status stored in the project document.
+        self._scheduler_status_poller = None
+        self._scheduler_status_timestamp = None
+
+    @property
+    def _environment(self):
+        "The compute environment associated with this project."
+        if self._environment_ is None:
+            self._environment_ = get_environment()
+        return self._environment_
+
+    @_environment.setter
+    def _environment(self, environment):
+        self._environment_ = environment
+
+    def __getstate__(self):
+        # The background poller thread is bound to this process and cannot be pickled.
+        state = self.__dict__.copy()
+        state['_scheduler_status_poller'] = None
+        # The label timings and the label cache are bound to this process as well.
+        state['_label_cache'] = None
+        del state['_label_timings']
+        del state['_label_timings_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._label_timings = defaultdict(lambda: [0, 0.0])
+        self._label_timings_lock = threading.Lock()
+
     def _setup_template_environment(self):
         """Setup the jinja2 template environment.
 
@@ -1243,6 +2001,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         and _submit_operations() / submit() function and the corresponding command line
         subcommands.
         """
+        import jinja2
+        from .errors import TemplateError
+
         if self._config.get('flow') and self._config['flow'].get('environment_modules'):
             envs = self._config['flow'].as_list('environment_modules')
         else:
@@ -1261,10 +2022,16 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                      extra_packages +
                      [jinja2.PackageLoader('flow', 'templates')])
 
+        if self._config['flow'].as_bool('use_template_bytecode_cache'):
+            bytecode_cache = _get_template_bytecode_cache()
+        else:
+            bytecode_cache = None
+
         template_environment = jinja2.Environment(
             loader=jinja2.ChoiceLoader(load_envs),
             trim_blocks=True,
-            extensions=[TemplateError])
+            extensions=[TemplateError],
+            bytecode_cache=bytecode_cache)
 
         # Setup standard filters that can be used to format context variables.
         template_environment.filters['format_timedelta'] = tf.format_timedelta
@@ -1290,14 +2057,19 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         if environment is None:
             environment = self._environment
         if environment not in self._template_environment_:
-            template_environment = self._setup_template_environment()
-
-            # Add environment-specific custom filters:
-            for name, member in inspect.getmembers(environment):
-                if getattr(member, '_flow_template_filter', False):
-                    template_environment.filters[name] = member
-
-            self._template_environment_[environment] = template_environment
+            key = (type(self), environment, self._template_dir,
+                   str(self._config['flow'].get('environment_modules')),
+                   self._config['flow'].as_bool('use_template_bytecode_cache'))
+            if key not in _TEMPLATE_ENVIRONMENTS:
+                template_environment = self._setup_template_environment()
+
+                # Add environment-specific custom filters:
+                for name, member in inspect.getmembers(environment):
+                    if getattr(member, '_flow_template_filter', False):
+                        template_environment.filters[name] = member
+
+                _TEMPLATE_ENVIRONMENTS[key] = template_environment
+            self._template_environment_[environment] = _TEMPLATE_ENVIRONMENTS[key]
         return self._template_environment_[environment]
 
     def _get_standard_template_context(self):
@@ -1380,9 +2152,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         an adjacency matrix based on whether the pre-conditions for one
         operation match the post-conditions for another. The comparison of
         operations is conservative; by default, conditions must be composed of
-        identical code to be identified as equal (technically, they must be
-        bytecode equivalent, i.e. ``cond1.__code__.co_code ==
-        cond2.__code__.co_code``). Users can specify that conditions should be
+        identical code to be identified as equal (technically, they must have
+        the same bytecode, constants, and referenced names, and their closures
+        must contain equal values). Users can specify that conditions should be
         treated as equal by providing tags to the operations.
 
         Given a FlowProject subclass defined in a module ``project.py``, the
@@ -1420,6 +2192,39 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
 
         """
 
+        graph = self._get_operation_graph()
+        index = {name: i for i, name in enumerate(graph.names)}
+        mat = [[0 for _ in range(len(index))] for _ in range(len(index))]
+        for a, downstream in graph.downstream.items():
+            for b in downstream:
+                mat[index[a]][index[b]] = 1
+        return mat
+
+    def _get_operation_graph(self):
+        """Return the sparse graph of operations defined by pre- and post-conditions.
+
+        The graph is cached on the class, keyed by the registered operations and
+        their conditions. See :meth:`~.detect_operation_graph` for details.
+
+        :raises: RuntimeError
+        :rtype:
+            :class:`~._OperationGraph`
+        """
+        key = tuple((name, tuple(cond._callback for cond in op._prereqs),
+                     tuple(cond._callback for cond in op._postconds))
+                    for name, op in self.operations.items())
+        try:
+            return type(self)._OPERATION_GRAPHS[key]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable condition, the graph cannot be cached.
+            return self._compute_operation_graph()
+        graph = type(self)._OPERATION_GRAPHS[key] = self._compute_operation_graph()
+        return graph
+
+    def _compute_operation_graph(self):
+        "Compute the graph of operations, see :meth:`~._get_operation_graph`."
+
         def to_callbacks(conditions):
             """Get the actual callables associated with FlowConditions."""
             return [condition._callback for condition in conditions]
@@ -1444,20 +2249,25 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
 
             return callbacks
 
-        ops = list(self.operations.items())
-        mat = [[0 for _ in range(len(ops))] for _ in range(len(ops))]
-
-        for i, (name1, op1) in enumerate(ops):
-            for j, (name2, op2) in enumerate(ops[i:]):
-                postconds1 = unpack_conditions(to_callbacks(op1._postconds))
-                postconds2 = unpack_conditions(to_callbacks(op2._postconds))
-                prereqs1 = unpack_conditions(to_callbacks(op1._prereqs))
-                prereqs2 = unpack_conditions(to_callbacks(op2._prereqs))
-                if postconds1.intersection(prereqs2):
-                    mat[i][j+i] = 1
-                elif prereqs1.intersection(postconds2):
-                    mat[j+i][i] = 1
-        return mat
+        names = list(self.operations)
+        position = {name: i for i, name in enumerate(names)}
+
+        # Index operations by the tags of their pre-conditions, so that the edges can be
+        # found without comparing all pairs of operations.
+        operations_by_prereq = defaultdict(list)
+        for name, op in self.operations.items():
+            for tag in unpack_conditions(to_callbacks(op._prereqs)):
+                operations_by_prereq[tag].append(name)
+        matches = set()
+        for name, op in self.operations.items():
+            for tag in unpack_conditions(to_callbacks(op._postconds)):
+                matches.update((name, b) for b in operations_by_prereq.get(tag, ()))
+
+        # For each pair of operations, the direction from the earlier registered
+        # operation to the later one takes precedence.
+        edges = [(a, b) for a, b in matches
+                 if position[a] <= position[b] or (b, a) not in matches]
+        return _OperationGraph(names, edges)
 
     def _register_class_labels(self):
         """This function registers all label functions, which are part of the class definition.
@@ -1474,15 +2284,28 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 class_label_functions[name] = function
 
         for name in sorted(class_label_functions):
-            self._label_functions[class_label_functions[name]] = None
+            self._label_functions[getattr(self, name)] = None
 
     def _register_labels(self):
-        "Register all label functions registered with this class and its parent classes."
+        """Register all label functions registered with this class and its parent classes.
+
+        The names of the labels and the calling convention of the label functions
+        are resolved once at registration, such that every label function is
+        called with the job as its only argument.
+        """
         self._register_class_labels()
 
         for cls in type(self).__mro__:
             self._label_functions.update(getattr(cls, '_LABEL_FUNCTIONS', dict()))
 
+        self._bound_label_functions = []
+        for label_func, label_name in self._label_functions.items():
+            if label_name is None:
+                label_name = getattr(label_func, '_label_name',
+                                     getattr(label_func, '__name__', type(label_func).__name__))
+            self._bound_label_functions.append(
+                (label_name, _bind_label_function(self, label_func)))
+
     ALIASES = {str(status).replace('JobStatus.', ''): symbol
                for status, symbol in _FMT_SCHEDULER_STATUS.items() if status != JobStatus.dummy}
     "These are default aliases used within the status output."
@@ -1529,6 +2352,156 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     file.write(operation.id + '\n')
             return bid
 
+    def _fn_work_queue(self, queue_id):
+        "Return the canonical name of the directory that stores a work queue."
+        return os.path.join(self.root_directory(), '.work_queue', queue_id)
+
+    def _enqueue_operations(self, operations, pretend=False):
+        """Place operations into a work queue and return the queue id.
+
+        Each operation is stored as a separate file in the directory determined
+        by the _fn_work_queue() method, from where it is claimed by exactly one
+        worker, see :meth:`~._run_work_queue`.
+
+        :param operations:
+            The operations to place into the queue.
+        :type operations:
+            A sequence of instances of :py:class:`._JobOperation`
+        :param pretend:
+            Only determine the queue id, but do not store the operations.
+        :type pretend:
+            bool
+        :return:
+            The queue id.
+        :rtype:
+            str
+        """
+        h = '.'.join(op.id for op in operations)
+        queue_id = sha1(h.encode('utf-8')).hexdigest()
+        if not pretend:
+            fn_queue = self._fn_work_queue(queue_id)
+            os.makedirs(os.path.join(fn_queue, '.claimed'), exist_ok=True)
+            for operation in operations:
+                name = sha1(operation.id.encode('utf-8')).hexdigest()
+                # Entries are moved into place so that workers never read partial files.
+                fn_tmp = os.path.join(fn_queue, '.claimed', name + '.tmp')
+                with open(fn_tmp, 'w') as file:
+                    json.dump(dict(id=operation.id, cmd=operation.cmd), file)
+                os.replace(fn_tmp, os.path.join(fn_queue, name))
+        return queue_id
+
+    def _claim_queued_operation(self, queue_id):
+        """Claim the next operation from a work queue.
+
+        Operations are claimed by renaming their entry, which is atomic, so that
+        concurrent workers never claim the same operation.
+
+        :return:
+            The filename of the claimed entry and the entry or None if the queue is empty.
+        :rtype:
+            tuple
+        """
+        fn_queue = self._fn_work_queue(queue_id)
+        try:
+            entries = sorted(fn for fn in os.listdir(fn_queue) if not fn.startswith('.'))
+        except FileNotFoundError:
+            return None
+        for fn in entries:
+            fn_claimed = os.path.join(fn_queue, '.claimed', fn)
+            try:
+                os.rename(os.path.join(fn_queue, fn), fn_claimed)
+            except FileNotFoundError:
+                continue  # claimed by another worker
+            with open(fn_claimed) as file:
+                return fn_claimed, json.load(file)
+        return None
+
+    def _remove_drained_work_queue(self, queue_id):
+        """Remove the directory of a work queue once all of its entries are finished.
+
+        The directory is kept while entries remain to be claimed or are executed by
+        a worker, and if it contains failed entries.
+        """
+        fn_queue = self._fn_work_queue(queue_id)
+        try:
+            if any(not fn.startswith('.') for fn in os.listdir(fn_queue)):
+                return  # entries remain to be claimed
+        except FileNotFoundError:
+            return
+        for fn in (os.path.join(fn_queue, '.claimed'), fn_queue, os.path.dirname(fn_queue)):
+            try:
+                os.rmdir(fn)
+            except OSError:     # not empty or already removed by another worker
+                return
+
+    def _run_work_queue(self, queue_id, walltime=None, timeout=None):
+        """Execute operations from a work queue until it is drained.
+
+        This is the entry point of a worker started within a cluster job, see the
+        ``num_workers`` argument of :meth:`~.submit`. Operations are executed one
+        after another, each with the command it would have been submitted with.
+        The worker stops when the queue is empty or when the remaining walltime
+        is shorter than the longest operation executed so far.
+
+        Entries of operations that fail are moved into the ``.failed`` subdirectory
+        of the queue, such that they are not claimed again by other workers, and the
+        worker continues with the next entry. The queue directory is removed once
+        the last entry is finished, unless it contains failed entries.
+
+        :param queue_id:
+            The id of the work queue.
+        :type queue_id:
+            str
+        :param walltime:
+            The walltime of the cluster job in hours or as instance of
+            :py:class:`datetime.timedelta`.
+        :param timeout:
+            A timeout in seconds after which the execution of one operation is canceled.
+        :type timeout:
+            int
+        :return:
+            The number of successfully executed operations.
+        :rtype:
+            int
+        """
+        if walltime is not None and not isinstance(walltime, datetime.timedelta):
+            walltime = datetime.timedelta(hours=walltime)
+        start = time.time()
+        longest = 0
+        num_executed = 0
+        while True:
+            if walltime is not None and \
+                    time.time() - start + longest > walltime.total_seconds():
+                logger.info("Stopping worker, because the walltime is about to expire.")
+                break
+            claimed = self._claim_queued_operation(queue_id)
+            if claimed is None:
+                logger.info("Stopping worker, because the work queue is empty.")
+                self._remove_drained_work_queue(queue_id)
+                break
+            fn_claimed, entry = claimed
+            fn_queue = self._fn_work_queue(queue_id)
+            logger.info("Execute operation '{}'...".format(entry['id']))
+            start_operation = time.time()
+            try:
+                subprocess.run(entry['cmd'], shell=True, timeout=timeout, check=True)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as error:
+                logger.error("Execution of operation '{}' failed: {}".format(entry['id'], error))
+                os.makedirs(os.path.join(fn_queue, '.failed'), exist_ok=True)
+                os.replace(fn_claimed, os.path.join(
+                    fn_queue, '.failed', os.path.basename(fn_claimed)))
+            except BaseException:
+                # The worker was interrupted; put the operation back into the queue
+                # so that it is not lost.
+                os.replace(fn_claimed, os.path.join(fn_queue, os.path.basename(fn_claimed)))
+                raise
+            else:
+                os.remove(fn_claimed)
+                num_executed += 1
+            longest = max(longest, time.time() - start_operation)
+            self._remove_drained_work_queue(queue_id)
+        return num_executed
+
     def _expand_bundled_jobs(self, scheduler_jobs):
         "Expand jobs which were submitted as part of a bundle."
         for job in scheduler_jobs:
@@ -1555,7 +2528,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         :yields:
             All scheduler jobs fetched from the scheduler instance.
         """
-        for sjob in self._expand_bundled_jobs(scheduler.jobs()):
+        with instrumentation._timer('scheduler_queries', type(scheduler).__name__):
+            scheduler_jobs = list(scheduler.jobs())
+        for sjob in self._expand_bundled_jobs(scheduler_jobs):
             yield sjob
 
     def _get_operations_status(self, job, cached_status):
@@ -1584,10 +2559,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         result['job_id'] = str(job)
         try:
             if cached_status is None:
-                try:
-                    cached_status = self.document['_status']._as_dict()
-                except KeyError:
-                    cached_status = dict()
+                cached_status = self._get_cached_status()
             result['operations'] = OrderedDict(self._get_operations_status(job, cached_status))
             result['_operations_error'] = None
         except Exception as error:
@@ -1610,26 +2582,87 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 raise
         return result
 
+    def _get_job_status_summary(self, job, ignore_errors=False, cached_status=None):
+        """Return the eligible operations and labels of a job.
+
+        This is a lightweight alternative to :meth:`~.get_job_status` for the aggregation
+        of the status overview, returned as a tuple of the names of eligible operations,
+        the labels, and the errors that occurred while determining either.
+        """
+        operations_error = labels_error = None
+        try:
+            if cached_status is None:
+                cached_status = self._get_cached_status()
+            eligible_operations = tuple(
+                name for name, status in self._get_operations_status(job, cached_status)
+                if status['eligible'])
+        except Exception as error:
+            logger.debug("Error while getting operations status for job '{}': '{}'.".format(
+                job, error))
+            if not ignore_errors:
+                raise
+            eligible_operations, operations_error = (), str(error)
+        try:
+            labels = tuple(set(self.labels(job)))
+        except Exception as error:
+            logger.debug("Error while determining labels for job '{}': '{}'.".format(job, error))
+            if not ignore_errors:
+                raise
+            labels, labels_error = (), str(error)
+        return eligible_operations, labels, operations_error, labels_error
+
+    def _get_cached_status(self):
+        "Return a copy of the scheduler status stored in the project document."
+        try:
+            with instrumentation._timer('document_reads', '_status'):
+                return self.document['_status']._as_dict()
+        except KeyError:
+            return dict()
+
+    def _query_scheduler_status(self, jobs=None, file=None):
+        """Query the scheduler and return the status of all job-groups.
+
+        :param jobs:
+            The jobs to determine the status for, defaults to all jobs.
+        :type jobs:
+            Sequence of instances :class:`.Job`.
+        :param file:
+            Show the progress on this file; no progress is shown if omitted.
+        :return:
+            A mapping of job-group ids to the integer value of their :class:`.JobStatus`.
+        :rtype:
+            dict
+        """
+        from tqdm import tqdm
+
+        if jobs is None:
+            jobs = list(self)
+        scheduler = self._environment.get_scheduler()
+        scheduler_info = {sjob.name(): sjob.status() for sjob in self.scheduler_jobs(scheduler)}
+        status = dict()
+        if file is not None:
+            print("Query scheduler...", file=file)
+        for job in tqdm(jobs,
+                        desc="Fetching operation status",
+                        total=len(jobs), file=file, disable=file is None):
+            for group in self._groups.values():
+                _id = group._generate_id(job)
+                status[_id] = int(scheduler_info.get(_id, JobStatus.unknown))
+        return status
+
     def _fetch_scheduler_status(self, jobs=None, file=None, ignore_errors=False):
         "Update the status docs."
         if file is None:
             file = sys.stderr
         if jobs is None:
             jobs = list(self)
+        if self._publish_scheduler_status():
+            return
         try:
-            scheduler = self._environment.get_scheduler()
-
+            status = self._query_scheduler_status(jobs, file)
             self.document.setdefault('_status', dict())
-            scheduler_info = {sjob.name(): sjob.status() for sjob in self.scheduler_jobs(scheduler)}
-            status = dict()
-            print("Query scheduler...", file=file)
-            for job in tqdm(jobs,
-                            desc="Fetching operation status",
-                            total=len(jobs), file=file):
-                for group in self._groups.values():
-                    _id = group._generate_id(job)
-                    status[_id] = int(scheduler_info.get(_id, JobStatus.unknown))
             self.document._status.update(status)
+            self._scheduler_status_timestamp = time.time()
         except NoSchedulerError:
             logger.debug("No scheduler available.")
         except RuntimeError as error:
@@ -1639,7 +2672,92 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         else:
             logger.info("Updated job status cache.")
 
-    def _fetch_status(self, jobs, err, ignore_errors, status_parallelization='thread'):
+    def _publish_scheduler_status(self):
+        """Store the most recent result of the background poller in the project document.
+
+        Results that are older than the last status update, e.g., from a submission,
+        are discarded.
+
+        :return:
+            Whether a background poller is active and the status was taken from it.
+        :rtype:
+            bool
+        """
+        poller = self._scheduler_status_poller
+        if poller is None or not poller.is_alive():
+            return False
+        timestamp, status = poller.snapshot()
+        if status is not None and (self._scheduler_status_timestamp is None or
+                                   timestamp > self._scheduler_status_timestamp):
+            self.document.setdefault('_status', dict())
+            self.document._status.update(status)
+            self._scheduler_status_timestamp = timestamp
+            logger.info("Updated job status cache from scheduler poller.")
+        return True
+
+    @contextlib.contextmanager
+    def poll_scheduler_status(self, interval=None):
+        """Continuously query the scheduler in a background thread.
+
+        Within this context, the scheduler status is refreshed every ``interval``
+        seconds by a background thread. Methods that require the scheduler status,
+        e.g., :meth:`~.print_status` and :meth:`~.submit`, use the most recent
+        result instead of querying the scheduler themselves. This is useful for
+        long-running sessions that repeatedly submit operations, for example:
+
+        .. code-block:: python
+
+            with project.poll_scheduler_status(interval=120):
+                while True:
+                    project.submit()
+                    time.sleep(600)
+
+        The interval is never shorter than the minimal time between two
+        scheduler queries permitted by the scheduler driver. If no scheduler
+        is available, no poller is started.
+
+        :param interval:
+            The time in seconds between two consecutive scheduler queries,
+            defaults to the ``scheduler_poll_interval`` configuration value.
+        :type interval:
+            float
+        :yields:
+            The background poller or None if no scheduler is available.
+        """
+        if self._scheduler_status_poller is not None:
+            raise RuntimeError("The scheduler status is already being polled.")
+        if interval is None:
+            interval = self.config['flow'].as_float('scheduler_poll_interval')
+        try:
+            scheduler = self._environment.get_scheduler()
+        except NoSchedulerError:
+            logger.debug("No scheduler available, the scheduler status is not polled.")
+            yield None
+            return
+        interval = max(interval, getattr(scheduler, '_dos_timeout', 0))
+        poller = _SchedulerStatusPoller(self, interval)
+        self._scheduler_status_poller = poller
+        poller.start()
+        try:
+            yield poller
+        finally:
+            poller.stop()
+            self._scheduler_status_poller = None
+
+    def _fetch_status(self, jobs, err, ignore_errors, status_parallelization='thread'):
+        return list(self._generate_status(jobs, err, ignore_errors, status_parallelization))
+
+    def _generate_status(self, jobs, err, ignore_errors, status_parallelization='thread',
+                         summary=False):
+        """Generate the status of the given jobs in order, as soon as it is determined.
+
+        The status of each job is summarized with :meth:`~._get_job_status_summary`
+        instead of :meth:`~.get_job_status` if summary is True.
+        """
+        status_method = '_get_job_status_summary' if summary else 'get_job_status'
+        from multiprocessing.pool import ThreadPool
+        from tqdm import tqdm
+
         # The argument status_parallelization is used so that _fetch_status method
         # gets to know whether the deprecated argument no_parallelization passed
         # while calling print_status is True or False. This can also be done by
@@ -1661,12 +2779,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     err.flush()
                 yield _
 
-        try:
-            cached_status = self.document['_status']._as_dict()
-        except KeyError:
-            cached_status = dict()
+        cached_status = self._get_cached_status()
 
-        _get_job_status = functools.partial(self.get_job_status,
+        _get_job_status = functools.partial(getattr(self, status_method),
                                             ignore_errors=ignore_errors,
                                             cached_status=cached_status)
 
@@ -1676,15 +2791,15 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     with contextlib.closing(ThreadPool()) as pool:
                         # First attempt at parallelized status determination.
                         # This may fail on systems that don't allow threads.
-                        return list(tqdm(
+                        yield from tqdm(
                             iterable=pool.imap(_get_job_status, jobs),
-                            desc="Collecting job status info", total=len(jobs), file=err))
+                            desc="Collecting job status info", total=len(jobs), file=err)
                 elif status_parallelization == 'process':
                     with contextlib.closing(Pool()) as pool:
                         try:
                             import pickle
                             results = self._fetch_status_in_parallel(
-                                pool, pickle, jobs, ignore_errors, cached_status)
+                                pool, pickle, jobs, ignore_errors, cached_status, status_method)
                         except Exception as error:
                             if not isinstance(error, (pickle.PickleError, self._PickleError)) and\
                                     'pickle' not in str(error).lower():
@@ -1701,18 +2816,19 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                             else:
                                 try:
                                     results = self._fetch_status_in_parallel(
-                                        pool, cloudpickle, jobs, ignore_errors, cached_status)
+                                        pool, cloudpickle, jobs, ignore_errors, cached_status,
+                                        status_method)
                                 except self._PickleError as error:
                                     raise RuntimeError(
                                         "Unable to parallelize execution due to a pickling "
                                         "error: {}.".format(error))
-                        return list(tqdm(
+                        yield from tqdm(
                             iterable=results,
-                            desc="Collecting job status info", total=len(jobs), file=err))
+                            desc="Collecting job status info", total=len(jobs), file=err)
                 elif status_parallelization == 'none':
-                    return list(tqdm(
+                    yield from tqdm(
                         iterable=map(_get_job_status, jobs),
-                        desc="Collecting job status info", total=len(jobs), file=err))
+                        desc="Collecting job status info", total=len(jobs), file=err)
                 else:
                     raise RuntimeError("Configuration value status_parallelization is invalid. "
                                        "You can set it to 'thread', 'parallel', or 'none'"
@@ -1723,9 +2839,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
 
                 t = time.time()
                 num_jobs = len(jobs)
-                statuses = []
                 for i, job in enumerate(jobs):
-                    statuses.append(_get_job_status(job))
+                    yield _get_job_status(job)
                     if time.time() - t > 0.2:  # status interval
                         print(
                             'Collecting job status info: {}/{}'.format(i+1, num_jobs),
@@ -1733,13 +2848,13 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                         t = time.time()
                 # Always print the completed progressbar.
                 print('Collecting job status info: {}/{}'.format(i+1, num_jobs), file=err)
-                return statuses
 
-    def _fetch_status_in_parallel(self, pool, pickle, jobs, ignore_errors, cached_status):
+    def _fetch_status_in_parallel(self, pool, pickle, jobs, ignore_errors, cached_status,
+                                  status_method='get_job_status'):
         try:
             s_project = pickle.dumps(self)
-            s_tasks = [(pickle.loads, s_project, job.get_id(), ignore_errors, cached_status)
-                       for job in jobs]
+            s_tasks = [(pickle.loads, s_project, job.get_id(), ignore_errors, cached_status,
+                        status_method) for job in jobs]
         except Exception as error:  # Masking all errors since they must be pickling related.
             raise self._PickleError(error)
 
@@ -1747,10 +2862,60 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
 
         return results
 
+    def _select_status_page(self, jobs, offset=0, limit=None, sort_by=None,
+                            eligible_operation=None, label=None, only_incomplete=False):
+        """Return one page of the sorted and filtered jobs for the status.
+
+        The filters are evaluated lazily, i.e., only for as many jobs as are
+        required to fill the page. Sorting only requires the job ids or the
+        state points and does not evaluate any conditions.
+        """
+        if offset < 0:
+            raise ValueError("The offset must not be negative.")
+        if limit is not None and limit < 0:
+            raise ValueError("The limit must not be negative.")
+
+        if sort_by == 'job_id':
+            jobs = sorted(jobs, key=str)
+        elif sort_by:
+            jobs = sorted(jobs, key=lambda job: _parameter_sort_key(
+                _get_nested(sort_by, job.statepoint())))
+
+        def _eligible(group, job):
+            return not group.complete(job) and group.eligible(job)
+
+        filters = []
+        if eligible_operation is not None:
+            try:
+                group = self._groups[eligible_operation]
+            except KeyError:
+                raise ValueError(
+                    "Unknown operation or group '{}'.".format(eligible_operation))
+            filters.append(functools.partial(_eligible, group))
+        elif only_incomplete:
+            filters.append(lambda job: any(
+                _eligible(group, job) for group in self._groups.values()))
+        if label is not None:
+            filters.append(lambda job: label in self.labels(job))
+
+        selected = (job for job in jobs if all(f(job) for f in filters))
+        return list(islice(selected, offset, None if limit is None else offset + limit))
+
+    @staticmethod
+    def _log_status_errors(errors):
+        "Log the unique errors that occurred during the status update."
+        if errors:
+            logger.warning(
+                "Some job status updates did not succeed due to errors. "
+                "Number of unique errors: {}. Use --debug to list all errors.".format(len(errors)))
+            for i, error in enumerate(errors):
+                logger.debug("Status update error #{}: '{}'".format(i + 1, error))
+
     PRINT_STATUS_ALL_VARYING_PARAMETERS = True
     """This constant can be used to signal that the print_status() method is supposed
     to automatically show all varying parameters."""
 
+    @_memoize_labels
     def print_status(self, jobs=None, overview=True, overview_max_lines=None,
                      detailed=False, parameters=None,
                      param_max_width=None,
@@ -1758,7 +2923,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                      unroll=True, compact=False, pretty=False,
                      file=None, err=None, ignore_errors=False,
                      no_parallelize=False, template=None, profile=False,
-                     eligible_jobs_max_lines=None, output_format='terminal'):
+                     eligible_jobs_max_lines=None, output_format='terminal', stream=False,
+                     columnar=False, offset=0, limit=None, sort_by=None,
+                     with_eligible_operation=None, with_label=None):
         """Print the status of the project.
 
         :param jobs:
@@ -1839,20 +3006,73 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             int
         :param output_format:
             Status output format, supports:
-            'terminal' (default), 'markdown' or 'html'.
+            'terminal' (default), 'markdown', 'html' or 'jsonl'. The 'jsonl' format
+            writes the status of each job as one line of JSON as soon as it is
+            determined and ignores all options of the formatted output.
         :type output_format:
             str
+        :param stream:
+            Print the rows of the detailed view as soon as the status of the
+            corresponding job is determined, followed by the overview. The columns
+            of streamed tables are not aligned and the 'html' output format is not
+            supported. Ignored when profiling or dumping JSON.
+        :type stream:
+            bool
+        :param columnar:
+            Collect the status of all jobs in NumPy arrays and compute the overview
+            and the filtering of incomplete jobs with array reductions. Requires NumPy;
+            ignored when profiling or streaming.
+        :type columnar:
+            bool
+        :param offset:
+            Skip this many of the selected jobs before showing the status.
+        :type offset:
+            int
+        :param limit:
+            Show the status of at most this many jobs.
+        :type limit:
+            int
+        :param sort_by:
+            Sort the jobs by 'job_id' or by a (dot-separated) state point key
+            before the offset and limit are applied. Sorting by a status field,
+            e.g., a label or an eligible operation, is not supported, since that
+            would require the status of all selected jobs to be determined.
+        :type sort_by:
+            str
+        :param with_eligible_operation:
+            Only show jobs for which this operation or group is eligible.
+        :type with_eligible_operation:
+            str
+        :param with_label:
+            Only show jobs with this label.
+        :type with_label:
+            str
         :return:
             A Renderer class object that contains the rendered string.
         :rtype:
             :py:class:`~.Renderer`
         """
+        from .render_status import Renderer as StatusRenderer
+
         if file is None:
             file = sys.stdout
         if err is None:
             err = sys.stderr
         if jobs is None:
             jobs = self     # all jobs
+        if offset or limit is not None or sort_by or with_eligible_operation or with_label:
+            jobs = self._select_status_page(
+                jobs, offset, limit, sort_by, with_eligible_operation, with_label,
+                only_incomplete)
+        stream = stream and not (profile or dump_json)
+        columnar = columnar and not (profile or stream)
+        if columnar:
+            try:
+                from .status import _ColumnarStatus
+            except ImportError:
+                raise RuntimeWarning(
+                    "The columnar status requires the numpy package. "
+                    "Install with `pip install numpy`.")
 
         if eligible_jobs_max_lines is None:
             eligible_jobs_max_lines = flow_config.get_config_value('eligible_jobs_max_lines')
@@ -1871,11 +3091,61 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         else:
             status_parallelization = self.config['flow']['status_parallelization']
 
+        if output_format == 'jsonl':
+            errors = set()
+            statuses = self._generate_status(jobs, err, ignore_errors, status_parallelization)
+            for status in statuses:
+                errors.update(filter(None, (status['_operations_error'],
+                                            status['_labels_error'])))
+                if only_incomplete and not any(
+                        op['eligible'] for op in status['operations'].values()):
+                    continue
+                file.write(json.dumps(status) + '\n')
+                file.flush()
+            self._log_status_errors(errors)
+            return
+
         # initialize jinja2 template environment and necessary filters
         template_environment = self._template_environment()
 
         context = self._get_standard_template_context()
 
+        if template is None and overview and not (detailed or dump_json or profile):
+            # Only the overview is requested with the default template, hence the label
+            # and operation counts are aggregated without keeping the status of the
+            # individual jobs. Custom templates may access the individual jobs.
+            num_jobs = 0
+            progress = Counter()
+            op_counter = Counter()
+            errors = set()
+            for eligible_operations, labels, *job_errors in self._generate_status(
+                    jobs, err, ignore_errors, status_parallelization, summary=True):
+                errors.update(filter(None, job_errors))
+                if only_incomplete and not eligible_operations:
+                    continue
+                num_jobs += 1
+                progress.update(labels)
+                op_counter.update(eligible_operations)
+            self._log_status_errors(errors)
+
+            context['jobs'] = range(num_jobs)
+            context['overview'] = True
+            context['detailed'] = False
+            context['progress_sorted'] = list(islice(
+                sorted(progress.items(), key=lambda x: (x[1], x[0]), reverse=True),
+                overview_max_lines))
+            context['op_counter'] = op_counter.most_common(eligible_jobs_max_lines)
+            n = len(op_counter) - len(context['op_counter'])
+            if n > 0:
+                context['op_counter'].append(('[{} more operations omitted]'.format(n), ''))
+
+            status_renderer = StatusRenderer()
+            te = deepcopy(template_environment) if status_parallelization == "process" \
+                else template_environment
+            print(status_renderer.render(template, te, context, detailed, expand, unroll,
+                                         compact, output_format), file=file)
+            return status_renderer
+
         # get job status information
         if profile:
             try:
@@ -1884,6 +3154,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 raise RuntimeWarning(
                     "Profiling requires the pprofile package. "
                     "Install with `pip install pprofile`.")
+            from multiprocessing.pool import ThreadPool
+            from tqdm import tqdm
             prof = pprofile.StatisticalProfile()
 
             fn_filter = [
@@ -1958,76 +3230,106 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     "Warning: Profiler ran only for a short time, "
                     "results may be highly inaccurate.")
 
+        elif stream:
+            # The status is determined lazily while the detailed view is rendered.
+            tmp = self._generate_status(jobs, err, ignore_errors, status_parallelization)
+            profiling_results = None
+        elif columnar:
+            tmp = _ColumnarStatus(
+                self._generate_status(jobs, err, ignore_errors, status_parallelization),
+                sorted(self._operations))
+            profiling_results = None
         else:
             tmp = self._fetch_status(jobs, err, ignore_errors, status_parallelization)
             profiling_results = None
 
-        operations_errors = {s['_operations_error'] for s in tmp}
-        labels_errors = {s['_labels_error'] for s in tmp}
-        errors = list(filter(None, operations_errors.union(labels_errors)))
+        errors = set()
 
-        if errors:
-            logger.warning(
-                "Some job status updates did not succeed due to errors. "
-                "Number of unique errors: {}. Use --debug to list all errors.".format(len(errors)))
-            for i, error in enumerate(errors):
-                logger.debug("Status update error #{}: '{}'".format(i + 1, error))
+        def _collect_errors(status):
+            errors.update(filter(None, (status['_operations_error'], status['_labels_error'])))
+            return status
 
-        if only_incomplete:
+        if columnar:
+            self._log_status_errors(tmp.errors)
+        else:
+            tmp = map(_collect_errors, tmp)
+        if not (stream or columnar):
+            tmp = list(tmp)
+            self._log_status_errors(errors)
+
+        if only_incomplete and columnar:
+            tmp = tmp.incomplete()
+        elif only_incomplete:
             # Remove all jobs from the status info, that have not a single
             # eligible operation.
 
             def _incomplete(s):
                 return any(op['eligible'] for op in s['operations'].values())
 
-            tmp = list(filter(_incomplete, tmp))
+            tmp = filter(_incomplete, tmp)
 
-        statuses = OrderedDict([(s['job_id'], s) for s in tmp])
+        if columnar:
+            statuses = tmp
+        elif not stream:
+            statuses = OrderedDict([(s['job_id'], s) for s in tmp])
 
         # If the dump_json variable is set, just dump all status info
         # formatted in JSON to screen.
-        if dump_json:
+        if dump_json and columnar:
+            statuses.dump_json(file)
+            return
+        elif dump_json:
             print(json.dumps(statuses, indent=4), file=file)
             return
 
-        if overview:
-            # get overview info:
-            progress = defaultdict(int)
-            for status in statuses.values():
-                for label in status['labels']:
-                    progress[label] += 1
-            progress_sorted = list(islice(
+        progress = defaultdict(int)
+
+        def _count_labels(status):
+            for label in status['labels']:
+                progress[label] += 1
+
+        def _sort_progress():
+            return list(islice(
                 sorted(progress.items(), key=lambda x: (x[1], x[0]), reverse=True),
                 overview_max_lines))
 
+        if overview and columnar:
+            progress.update(statuses.label_counts())
+            progress_sorted = _sort_progress()
+        elif overview and not stream:
+            # get overview info:
+            for status in statuses.values():
+                _count_labels(status)
+            progress_sorted = _sort_progress()
+
+        if parameters:
+            # Load the state point of each job only once.
+            statepoints = {str(job): job.statepoint() for job in jobs}
+
         # Optionally expand parameters argument to all varying parameters.
         if parameters is self.PRINT_STATUS_ALL_VARYING_PARAMETERS:
-            parameters = list(
-                sorted({key for job in jobs for key in job.sp.keys() if
-                        len(set([to_hashable(job.sp().get(key)) for job in jobs])) > 1}))
+            parameters = _get_varying_keys(statepoints.values())
 
         if parameters:
             # get parameters info
+            parameter_keys = list(parameters)
 
-            def _add_parameters(status):
-                sp = self.open_job(id=status['job_id']).statepoint()
-
-                def get(k, m):
-                    if m is None:
-                        return
-                    t = k.split('.')
-                    if len(t) > 1:
-                        return get('.'.join(t[1:]), m.get(t[0]))
-                    else:
-                        return m.get(k)
+            def _get_parameters(job_id):
+                sp = statepoints[job_id]
+                parameters = OrderedDict()
+                for i, k in enumerate(parameter_keys):
+                    v = shorten(str(self._alias(_get_nested(k, sp))), param_max_width)
+                    parameters[k] = v
+                return parameters
 
-                status['parameters'] = OrderedDict()
-                for i, k in enumerate(parameters):
-                    v = shorten(str(self._alias(get(k, sp))), param_max_width)
-                    status['parameters'][k] = v
+            def _add_parameters(status):
+                status['parameters'] = _get_parameters(status['job_id'])
 
-            for status in statuses.values():
-                _add_parameters(status)
+            if columnar:
+                statuses.parameters = list(map(_get_parameters, statuses.job_ids))
+            elif not stream:
+                for status in statuses.values():
+                    _add_parameters(status)
 
             for i, para in enumerate(parameters):
                 parameters[i] = shorten(self._alias(str(para)), param_max_width)
@@ -2060,7 +3362,10 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             operation_status_legend = ' '.join('[{}]:{}'.format(v, k)
                                                for k, v in OPERATION_STATUS_SYMBOLS.items())
 
-        context['jobs'] = list(statuses.values())
+        if columnar:
+            context['jobs'] = statuses
+        elif not stream:
+            context['jobs'] = list(statuses.values())
         context['overview'] = overview
         context['detailed'] = detailed
         context['all_ops'] = all_ops
@@ -2068,7 +3373,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         context['compact'] = compact
         context['pretty'] = pretty
         context['unroll'] = unroll
-        if overview:
+        if overview and not stream:
             context['progress_sorted'] = progress_sorted
         if detailed:
             context['alias_bool'] = {True: 'Y', False: 'N'}
@@ -2086,20 +3391,24 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 'eligible': False,
                 'scheduler_status': JobStatus.dummy}
 
-        for job in context['jobs']:
+        def _add_operations(job):
             has_eligible_ops = any([v['eligible'] for v in job['operations'].values()])
             if not has_eligible_ops and not context['all_ops']:
                 _add_dummy_operation(job)
 
         op_counter = Counter()
-        for job in context['jobs']:
+
+        def _count_operations(job):
             for k, v in job['operations'].items():
                 if k != '' and v['eligible']:
                     op_counter[k] += 1
-        context['op_counter'] = op_counter.most_common(eligible_jobs_max_lines)
-        n = len(op_counter) - len(context['op_counter'])
-        if n > 0:
-            context['op_counter'].append(('[{} more operations omitted]'.format(n), ''))
+
+        def _most_common_operations():
+            most_common = op_counter.most_common(eligible_jobs_max_lines)
+            n = len(op_counter) - len(most_common)
+            if n > 0:
+                most_common.append(('[{} more operations omitted]'.format(n), ''))
+            return most_common
 
         status_renderer = StatusRenderer()
         # We have to make a deep copy of the template environment if we're
@@ -2111,6 +3420,46 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         # succeed).
         te = deepcopy(template_environment) if status_parallelization == "process" \
             else template_environment
+
+        if stream:
+            num_jobs = 0
+
+            def _prepare(job):
+                nonlocal num_jobs
+                num_jobs += 1
+                _count_labels(job)
+                if parameters:
+                    _add_parameters(job)
+                _add_operations(job)
+                _count_operations(job)
+                return job
+
+            prepared = map(_prepare, tmp)
+            if detailed:
+                status_renderer.stream(template, te, dict(context, jobs=prepared, overview=False),
+                                       detailed, expand, unroll, compact, output_format, file)
+            else:
+                for _ in prepared:
+                    pass
+            if overview:
+                context['jobs'] = range(num_jobs)
+                context['progress_sorted'] = _sort_progress()
+                context['op_counter'] = _most_common_operations()
+                status_renderer.stream(template, te, dict(context, detailed=False),
+                                       False, expand, unroll, compact, output_format, file)
+            self._log_status_errors(errors)
+            return status_renderer
+
+        if columnar:
+            statuses.dummy_operation = not all_ops
+            op_counter.update(statuses.eligible_counts())
+        else:
+            for job in context['jobs']:
+                _add_operations(job)
+
+            for job in context['jobs']:
+                _count_operations(job)
+        context['op_counter'] = _most_common_operations()
         render_output = status_renderer.render(template, te, context, detailed,
                                                expand, unroll, compact, output_format)
 
@@ -2150,6 +3499,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         :type progress:
             bool
         """
+        from tqdm import tqdm
+
         if timeout is not None and timeout < 0:
             timeout = None
         if operations is None:
@@ -2164,31 +3515,153 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 self._execute_operation(operation, timeout, pretend)
         else:
             logger.debug("Parallelized execution of {} operation(s).".format(len(operations)))
-            with contextlib.closing(Pool(processes=cpu_count() if np < 0 else np)) as pool:
-                logger.debug("Parallelized execution of {} operation(s).".format(len(operations)))
-                try:
-                    import pickle
-                    self._run_operations_in_parallel(pool, pickle, operations, progress, timeout)
-                    logger.debug("Used cPickle module for serialization.")
-                except Exception as error:
-                    if not isinstance(error, (pickle.PickleError, self._PickleError)) and\
-                            'pickle' not in str(error).lower():
-                        raise    # most likely not a pickle related error...
+            self._run_in_process_pool(np, functools.partial(
+                self._run_operations_in_parallel,
+                operations=operations, progress=progress, timeout=timeout))
+
+    def _run_in_process_pool(self, np, func):
+        """Call func(pool, pickle) with a process pool of np processes.
+
+        The standard pickle module is used for serialization by default, with a fallback
+        to cloudpickle in case of a pickling error.
+        """
+        with contextlib.closing(Pool(processes=cpu_count() if np < 0 else np)) as pool:
+            try:
+                import pickle
+                func(pool, pickle)
+                logger.debug("Used cPickle module for serialization.")
+            except Exception as error:
+                if not isinstance(error, (pickle.PickleError, self._PickleError)) and\
+                        'pickle' not in str(error).lower():
+                    raise    # most likely not a pickle related error...
 
+                try:
+                    import cloudpickle
+                except ImportError:  # The cloudpickle package is not available.
+                    logger.error("Unable to parallelize execution due to a pickling error. "
+                                 "\n\n - Try to install the 'cloudpickle' package, e.g., with "
+                                 "'pip install cloudpickle'!\n")
+                    raise error
+                else:
                     try:
-                        import cloudpickle
-                    except ImportError:  # The cloudpickle package is not available.
-                        logger.error("Unable to parallelize execution due to a pickling error. "
-                                     "\n\n - Try to install the 'cloudpickle' package, e.g., with "
-                                     "'pip install cloudpickle'!\n")
-                        raise error
-                    else:
-                        try:
-                            self._run_operations_in_parallel(
-                                pool, cloudpickle, operations, progress, timeout)
-                        except self._PickleError as error:
-                            raise RuntimeError("Unable to parallelize execution due to a pickling "
-                                               "error: {}.".format(error))
+                        func(pool, cloudpickle)
+                    except self._PickleError as error:
+                        raise RuntimeError("Unable to parallelize execution due to a pickling "
+                                           "error: {}.".format(error))
+
+    def _run_pipeline(self, job, names, ignore_conditions=IgnoreConditions.NONE, pretend=False,
+                      timeout=None, num_passes=1, num=None):
+        """Execute the operations of one job as a pipeline.
+
+        Operations are executed one after another in topological order of the
+        operation graph. After each execution, the executed operation, the operations
+        downstream of it, and the operations that were eligible before are checked
+        for eligibility again. All other operations are only checked once none of
+        those is eligible anymore. The pipeline ends when no operation is eligible.
+
+        :param job:
+            The job to execute operations for.
+        :type job:
+            :class:`~signac.contrib.job.Job`
+        :param names:
+            The names of the operations or groups to execute.
+        :type names:
+            Sequence of :class:`str`
+        :return:
+            The number of executed operations.
+        :rtype:
+            int
+
+        See :meth:`~.run` for the other arguments.
+        """
+        default_directives = self._get_default_directives()
+        flow_groups = self._gather_flow_groups(names)
+        try:
+            graph = self._get_operation_graph()
+        except RuntimeError:
+            graph = None
+        num_executions = defaultdict(int)
+
+        def get_eligible_operations(candidates=None):
+            operations = OrderedDict()
+            for flow_group in flow_groups:
+                for name, op in flow_group.operations.items():
+                    if name in operations or (candidates is not None and name not in candidates):
+                        continue
+                    if num_passes is not None and num_executions[name] >= num_passes:
+                        continue
+                    if op.eligible(job, ignore_conditions):
+                        operations[name] = flow_group._create_run_job_operation(
+                            self._entrypoint, default_directives, job, name, op, index=0)
+            operations = list(operations.values())
+            if graph is not None:
+                operations.sort(key=lambda op: graph.rank[op.name])
+            return operations
+
+        num_executed = 0
+        operations = get_eligible_operations()
+        while operations and (num is None or num_executed < num):
+            operation = operations.pop(0)
+            self._execute_operation(operation, timeout, pretend)
+            num_executions[operation.name] += 1
+            num_executed += 1
+            if graph is None:
+                operations = get_eligible_operations()
+            else:
+                candidates = {operation.name}.union(
+                    graph.downstream[operation.name], (op.name for op in operations))
+                operations = get_eligible_operations(candidates) or get_eligible_operations()
+        return num_executed
+
+    def _run_pipelines(self, jobs, names, ignore_conditions=IgnoreConditions.NONE,
+                       pretend=False, np=None, timeout=None, num=None, num_passes=1,
+                       progress=False):
+        """Execute the operations of each job as a pipeline, see :meth:`~._run_pipeline`.
+
+        The pipelines of different jobs are executed independently of each other and
+        in parallel if np is provided.
+        """
+        from tqdm import tqdm
+
+        if timeout is not None and timeout < 0:
+            timeout = None
+        jobs = list(jobs)
+        kwargs = dict(names=names, ignore_conditions=ignore_conditions,
+                      timeout=timeout, num_passes=num_passes)
+        if np is None or np == 1 or pretend:
+            num_executed = 0
+            for job in tqdm(jobs) if progress else jobs:
+                if num is not None and num_executed >= num:
+                    logger.warning("Reached the maximum number of operations that can be "
+                                   "executed, but there are still operations pending.")
+                    break
+                num_executed += self._run_pipeline(
+                    job, pretend=pretend, num=None if num is None else num - num_executed,
+                    **kwargs)
+        else:
+            if num is not None:
+                raise ValueError(
+                    "The num argument is not supported for the parallel execution of "
+                    "pipelines.")
+            logger.debug("Parallelized execution of {} pipeline(s).".format(len(jobs)))
+            self._run_in_process_pool(np, functools.partial(
+                self._run_pipelines_in_parallel, jobs=jobs, progress=progress, **kwargs))
+
+    def _run_pipelines_in_parallel(self, pool, pickle, jobs, progress, **kwargs):
+        "Execute the pipelines of the given jobs with the provided process pool."
+        from tqdm import tqdm
+
+        try:
+            s_project = pickle.dumps(self)
+        except Exception as error:  # Masking all errors since they must be pickling related.
+            raise self._PickleError(error)
+
+        results = [pool.apply_async(_execute_serialized_pipeline,
+                                    (pickle.loads, s_project, job.get_id(), kwargs))
+                   for job in jobs]
+
+        for result in tqdm(results) if progress else results:
+            result.get()
 
     @deprecated(deprecated_in="0.11", removed_in="0.13", current_version=__version__)
     def run_operations(self, operations=None, pretend=False, np=None, timeout=None, progress=False):
@@ -2226,7 +3699,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
 
     @staticmethod
     def _dumps_op(op):
-        return (op.id, op.name, op.job._id, op.cmd, op.directives)
+        return (op.id, op.name, op.job._id, op.cmd, dict(op.directives))
 
     def _loads_op(self, blob):
         id, name, job_id, cmd, directives = blob
@@ -2241,6 +3714,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         project instance and the operations before submitting them to the process pool to
         enable us to try different pool and pickle module combinations.
         """
+        from tqdm import tqdm
 
         try:
             s_project = pickle.dumps(self)
@@ -2260,41 +3734,43 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             return None
 
         logger.info("Execute operation '{}'...".format(operation))
-        # Check if we need to fork for operation execution...
-        if (
-            # The 'fork' directive was provided and evaluates to True:
-            operation.directives.get('fork', False)
-            # Separate process needed to cancel with timeout:
-            or timeout is not None
-            # The operation function is of an instance of FlowCmdOperation:
-            or isinstance(self._operations[operation.name], FlowCmdOperation)
-            # The specified executable is not the same as the interpreter instance:
-            or operation.directives.get('executable', sys.executable) != sys.executable
-        ):
-            # ... need to fork:
-            logger.debug(
-                "Forking to execute operation '{}' with "
-                "cmd '{}'.".format(operation, operation.cmd))
-            subprocess.run(operation.cmd, shell=True, timeout=timeout,
-                           check=True)
-        else:
-            # ... executing operation in interpreter process as function:
-            logger.debug(
-                "Executing operation '{}' with current interpreter "
-                "process ({}).".format(operation, os.getpid()))
-            try:
-                self._operations[operation.name](operation.job)
-            except Exception as e:
-                raise UserOperationError(
-                    'An exception was raised during operation {operation.name} '
-                    'for job {operation.job}.'.format(operation=operation)) from e
+        with instrumentation._timer('operations', operation.name):
+            # Check if we need to fork for operation execution...
+            if (
+                # The 'fork' directive was provided and evaluates to True:
+                operation.directives.get('fork', False)
+                # Separate process needed to cancel with timeout:
+                or timeout is not None
+                # The operation function is of an instance of FlowCmdOperation:
+                or isinstance(self._operations[operation.name], FlowCmdOperation)
+                # The specified executable is not the same as the interpreter instance:
+                or operation.directives.get('executable', sys.executable) != sys.executable
+            ):
+                # ... need to fork:
+                logger.debug(
+                    "Forking to execute operation '{}' with "
+                    "cmd '{}'.".format(operation, operation.cmd))
+                subprocess.run(operation.cmd, shell=True, timeout=timeout,
+                               check=True)
+            else:
+                # ... executing operation in interpreter process as function:
+                logger.debug(
+                    "Executing operation '{}' with current interpreter "
+                    "process ({}).".format(operation, os.getpid()))
+                try:
+                    self._operations[operation.name](operation.job)
+                except Exception as e:
+                    raise UserOperationError(
+                        'An exception was raised during operation {operation.name} '
+                        'for job {operation.job}.'.format(operation=operation)) from e
 
     def _get_default_directives(self):
         return {name: self.groups[name].operation_directives.get(name, dict())
                 for name in self.operations}
 
     def run(self, jobs=None, names=None, pretend=False, np=None, timeout=None, num=None,
-            num_passes=1, progress=False, order=None, ignore_conditions=IgnoreConditions.NONE):
+            num_passes=1, progress=False, order=None, ignore_conditions=IgnoreConditions.NONE,
+            target=None):
         """Execute all pending operations for the given selection.
 
         This function will run in an infinite loop until all pending operations
@@ -2305,6 +3781,10 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         operation will only be executed once per job. This is to avoid accidental
         infinite loops when no or faulty post conditions are provided.
 
+        Within each pass, operations are executed in topological order of the graph
+        determined by :meth:`~.detect_operation_graph`. An operation is deferred to
+        the next pass if an operation upstream of it is executed for the same job.
+
         See also: :meth:`~.run_operations`
 
         :param jobs:
@@ -2350,6 +3830,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 * 'by-job' (operations are grouped by job)
                 * 'cyclic' (order operations cyclic by job)
                 * 'random' (shuffle the execution order randomly)
+                * 'pipeline' (execute the operations of each job one after another
+                              without waiting for the operations of other jobs,
+                              see :meth:`~._run_pipeline`)
                 * callable (a callable returning a comparison key for an
                             operation used to sort operations)
 
@@ -2368,6 +3851,13 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             The default is :py:class:`IgnoreConditions.NONE`.
         :type ignore_conditions:
             :py:class:`~.IgnoreConditions`
+        :param target:
+            Only execute the given operation and the operations upstream of it, as
+            determined by :meth:`~.detect_operation_graph`. No further operations are
+            executed for a job once the target operation is complete for it. Cannot be
+            combined with the names argument.
+        :type target:
+            str
         """
         # If no jobs argument is provided, we run operations for all jobs.
         if jobs is None:
@@ -2378,9 +3868,25 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             raise ValueError(
                 "The names argument of FlowProject.run() must be a sequence of strings, "
                 "not a string.")
+        if target is not None:
+            if names is not None:
+                raise ValueError(
+                    "The names and target arguments of FlowProject.run() cannot be "
+                    "used in combination.")
+            if target not in self.operations:
+                raise ValueError("Unknown target operation '{}'.".format(target))
+            # Only the operations required for the target are considered at all.
+            closure = self._get_operation_graph().upstream_closure(target)
+            names = [re.escape(name) for name in self.operations if name in closure]
         if names is None:
             names = list(self.operations)
 
+        def pending(jobs):
+            "Return the jobs for which the target operation is not complete."
+            if target is None:
+                return jobs
+            return [job for job in jobs if not self.operations[target].complete(job)]
+
         flow_groups = self._gather_flow_groups(names)
 
         # Get default directives
@@ -2397,6 +3903,12 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 "The ignore_conditions argument of FlowProject.run() "
                 "must be a member of class IgnoreConditions")
 
+        if order == 'pipeline':
+            self._run_pipelines(pending(jobs), names, ignore_conditions=ignore_conditions,
+                                pretend=pretend, np=np, timeout=timeout, num=num,
+                                num_passes=num_passes, progress=progress)
+            return
+
         messages = list()
 
         def log(msg, lvl=logging.INFO):
@@ -2431,6 +3943,38 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             select.total_execution_count += 1
             return True
 
+        # Operations are executed in topological order of the operation graph, if the
+        # graph can be determined.
+        try:
+            graph = self._get_operation_graph()
+        except RuntimeError as error:
+            logger.debug("Unable to determine the operation graph: {}".format(error))
+            graph = None
+
+        def schedule(operations):
+            """Select operations for execution in topological order.
+
+            An operation is deferred to the next pass if an operation upstream of it
+            is executed for the same job within this pass, because the prerequisites
+            of the downstream operation may not be satisfied anymore thereafter.
+            """
+            selected = list()
+            executed = set()
+            for operation in sorted(operations, key=lambda op: graph.rank[op.name]):
+                upstream = graph.upstream[operation.name]
+                if any((operation.job, name) in executed for name in upstream):
+                    log("Operation '{}' is deferred until its upstream operations "
+                        "were executed.".format(operation), logging.DEBUG)
+                    continue
+                try:
+                    if not select(operation):
+                        continue
+                except StopIteration:
+                    break
+                executed.add((operation.job, operation.name))
+                selected.append(operation)
+            return selected
+
         # Keep track of all executed job-operations; the number of executions
         # of each individual job-operation cannot exceed num_passes.
         select.num_executions = defaultdict(int)
@@ -2449,13 +3993,17 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 # Change groups to available run _JobOperation(s)
                 with self._potentially_buffered():
                     operations = []
+                    pending_jobs = pending(jobs)
                     for flow_group in flow_groups:
-                        for job in jobs:
+                        for job in pending_jobs:
                             operations.extend(
                                 flow_group._create_run_job_operations(
                                     self._entrypoint, default_directives, job, ignore_conditions))
 
-                    operations = list(filter(select, operations))
+                    if graph is None:
+                        operations = list(filter(select, operations))
+                    else:
+                        operations = schedule(operations)
             finally:
                 if messages:
                     for msg, level in set(messages):
@@ -2478,7 +4026,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             else:
                 raise ValueError(
                     "Invalid value for the 'order' argument, valid arguments are "
-                    "'none', 'by-job', 'cyclic', 'random', None, or a callable.")
+                    "'none', 'by-job', 'cyclic', 'random', 'pipeline', None, or a callable.")
 
             logger.info(
                 "Executing {} operation(s) (Pass # {:02d})...".format(len(operations), i_pass))
@@ -2520,15 +4068,25 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                                    ignore_conditions=IgnoreConditions.NONE,
                                    ignore_conditions_on_execution=IgnoreConditions.NONE):
         """Grabs _JobOperations that are eligible to run from FlowGroups."""
+        flow_groups = self._gather_flow_groups(names)
+        cached_status = self._get_cached_status()
         for job in jobs:
-            for group in self._gather_flow_groups(names):
-                if group.eligible(job, ignore_conditions) and self._eligible_for_submission(group,
-                                                                                            job):
+            active_groups = self._get_active_groups_mask(job, cached_status)
+            for group in flow_groups:
+                if not self._eligible_for_submission(group, job, active_groups):
+                    continue
+                # The conditions are evaluated once for both the eligibility of the group
+                # and the submission operation; only conditions ignored for both are skipped.
+                conditions = group._evaluate_conditions(
+                    job, ignore_conditions & ignore_conditions_on_execution)
+                if any(all(_apply_ignored_conditions(c, ignore_conditions))
+                       for c in conditions.values()):
                     yield group._create_submission_job_operation(
                         entrypoint=self._entrypoint,
                         default_directives=default_directives,
                         job=job, index=0,
-                        ignore_conditions_on_execution=ignore_conditions_on_execution)
+                        ignore_conditions_on_execution=ignore_conditions_on_execution,
+                        conditions=conditions)
 
     def _get_pending_operations(self, jobs, operation_names=None,
                                 ignore_conditions=IgnoreConditions.NONE):
@@ -2553,7 +4111,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         else:
             yield
 
-    def _script(self, operations, parallel=False, template='script.sh', show_template_help=False):
+    def _script(self, operations, parallel=False, template='script.sh', show_template_help=False,
+                collapse=False):
         """Generate a run script to execute given operations.
 
         :param operations:
@@ -2572,6 +4131,11 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             Show help related to the templating system and then exit.
         :type show_template_help:
             bool
+        :param collapse:
+            Execute the same group for multiple jobs with a single command, unless
+            the operations are executed in parallel (default is False).
+        :type collapse:
+            bool
         """
         template_environment = self._template_environment()
         template = template_environment.get_template(template)
@@ -2579,11 +4143,14 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         # For script generation we do not need the extra logic used for
         # generating cluster job scripts.
         context['base_script'] = 'base_script.sh'
-        context['operations'] = list(operations)
+        operations = list(operations)
+        context['operations'] = _collapse_operations(operations) \
+            if collapse and not parallel else operations
         context['parallel'] = parallel
         if show_template_help:
             self._show_template_help_and_exit(template_environment, context)
-        return template.render(** context)
+        with instrumentation._timer('template_renders', template.name):
+            return template.render(** context)
 
     @deprecated(deprecated_in="0.11", removed_in="0.13", current_version=__version__)
     def script(self, operations, parallel=False, template='script.sh', show_template_help=False):
@@ -2608,11 +4175,18 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         """
         return self._script(operations, parallel, template, show_template_help)
 
-    def _generate_submit_script(self, _id, operations, template, show_template_help, env, **kwargs):
-        """Generate submission script to submit the execution of operations to a scheduler."""
+    def _submit_script_renderer(self, template, show_template_help, env, collapse=False,
+                                **kwargs):
+        """Prepare the rendering of submission scripts.
+
+        The template is loaded and the template context is set up only once. The returned
+        function renders the submission script for one bundle of operations when called
+        with the bundle's ``_id`` and ``operations``. Unless the operations are executed
+        in parallel, the same group is executed for multiple jobs with a single command
+        if ``collapse`` is True.
+        """
         if template is None:
             template = env.template
-        assert _id is not None
 
         template_environment = self._template_environment(env)
         template = template_environment.get_template(template)
@@ -2627,12 +4201,41 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         logger.info("Set 'base_script={}'.".format(env.template))
         context['base_script'] = env.template
         context['environment'] = env
-        context['id'] = _id
-        context['operations'] = list(operations)
         context.update(kwargs)
-        if show_template_help:
-            self._show_template_help_and_exit(template_environment, context)
-        return template.render(** context)
+
+        def render(_id, operations):
+            assert _id is not None
+            context['id'] = _id
+            operations = list(operations)
+            context['operations'] = _collapse_operations(operations) \
+                if collapse and not context.get('parallel') else operations
+            if show_template_help:
+                self._show_template_help_and_exit(template_environment, context)
+            with instrumentation._timer('template_renders', template.name):
+                return template.render(** context)
+
+        return render
+
+    def _generate_submit_scripts(self, bundles, template, show_template_help, env, **kwargs):
+        """Generate the submission scripts for many bundles of operations in one pass.
+
+        :param bundles:
+            The bundles of operations as ``(_id, operations)`` tuples.
+        :type bundles:
+            iterable
+        :return:
+            An iterator over the submission script of each bundle.
+        :rtype:
+            Iterator[str]
+        """
+        render = self._submit_script_renderer(template, show_template_help, env, **kwargs)
+        for _id, operations in bundles:
+            yield render(_id, operations)
+
+    def _generate_submit_script(self, _id, operations, template, show_template_help, env, **kwargs):
+        """Generate submission script to submit the execution of operations to a scheduler."""
+        return next(self._generate_submit_scripts(
+            [(_id, operations)], template, show_template_help, env, **kwargs))
 
     def _submit_operations(self, operations, _id=None, env=None, parallel=False, flags=None,
                            force=False, template='script.sh', pretend=False,
@@ -2677,8 +4280,35 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         :return:
             Returns the submission status after successful submission or None.
         """
-        if _id is None:
-            _id = self._store_bundled(operations)
+        (_, status), = self._submit_bundles(
+            [(_id, operations)], env=env, parallel=parallel, flags=flags, force=force,
+            template=template, pretend=pretend, show_template_help=show_template_help,
+            **kwargs)
+        return status
+
+    def _submit_bundles(self, bundles, env=None, parallel=False, flags=None, force=False,
+                        template='script.sh', pretend=False, show_template_help=False,
+                        collapse=False, **kwargs):
+        r"""Submit bundles of operations to the scheduler.
+
+        The submission scripts of all bundles are rendered with the same prepared
+        template and context, see :meth:`~._generate_submit_scripts`. The arguments
+        are the same as for :meth:`~._submit_operations`, except for:
+
+        :param bundles:
+            The bundles of operations as ``(_id, operations)`` tuples. The _id is
+            generated from the operations if it is None.
+        :type bundles:
+            iterable
+        :param collapse:
+            Execute the same group for multiple jobs of a serial bundle with a
+            single command.
+        :type collapse:
+            bool
+        :return:
+            An iterator over tuples of the operations and the submission status
+            (or None) of each bundle.
+        """
         if env is None:
             env = self._environment
         else:
@@ -2686,50 +4316,44 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                           "Instead, set the environment when constructing a FlowProject.",
                           DeprecationWarning)
 
-        print("Submitting cluster job '{}':".format(_id), file=sys.stderr)
+        render = self._submit_script_renderer(
+            template, show_template_help, env, collapse=collapse, parallel=parallel, force=force,
+            **kwargs)
 
         def _msg(group):
             print(" - Group: {}".format(group), file=sys.stderr)
             return group
 
-        try:
-            script = self._generate_submit_script(
-                _id=_id,
-                operations=map(_msg, operations),
-                template=template,
-                show_template_help=show_template_help,
-                env=env,
-                parallel=parallel,
-                force=force,
-                **kwargs
-            )
-        except ConfigKeyError as error:
-            raise SubmitError(
-                "Unable to submit, because of a configuration error.\n"
-                "The following key is missing: {key}.\n"
-                "You can add the key to the configuration for example with:\n\n"
-                "  $ signac config --global set {key} VALUE\n".format(key=str(error)))
-        else:
-            # Keys which were explicitly set by the user, but are not evaluated by the
-            # template engine are cause for concern and might hint at a bug in the template
-            # script or ill-defined directives. Here we check whether all directive keys that
-            # have been explicitly set by the user were actually evaluated by the template
-            # engine and warn about those that have not been.
-            keys_unused = {
-                key for op in operations for key in
-                op.directives._keys_set_by_user.difference(op.directives.keys_used)
-                if key not in ('fork', 'nranks', 'omp_num_threads')  # ignore list
-            }
-            if keys_unused:
-                logger.warning(
-                    "Some of the keys provided as part of the directives were not used by "
-                    "the template script, including: {}".format(
-                        ', '.join(sorted(keys_unused))))
-            if pretend:
-                print(script)
+        for _id, operations in bundles:
+            if _id is None:
+                _id = self._store_bundled(operations)
 
+            print("Submitting cluster job '{}':".format(_id), file=sys.stderr)
+
+            try:
+                with _track_directives_usage(operations) as keys_unused:
+                    script = render(_id, map(_msg, operations))
+            except ConfigKeyError as error:
+                raise SubmitError(
+                    "Unable to submit, because of a configuration error.\n"
+                    "The following key is missing: {key}.\n"
+                    "You can add the key to the configuration for example with:\n\n"
+                    "  $ signac config --global set {key} VALUE\n".format(key=str(error)))
             else:
-                return env.submit(_id=_id, script=script, flags=flags, **kwargs)
+                # Here we check whether all directive keys that have been explicitly set
+                # by the user were actually evaluated by the template engine and warn
+                # about those that have not been.
+                keys_unused.difference_update(('fork', 'nranks', 'omp_num_threads'))  # ignore list
+                if keys_unused:
+                    logger.warning(
+                        "Some of the keys provided as part of the directives were not used by "
+                        "the template script, including: {}".format(
+                            ', '.join(sorted(keys_unused))))
+                if pretend:
+                    print(script)
+                    yield operations, None
+                else:
+                    yield operations, env.submit(_id=_id, script=script, flags=flags, **kwargs)
 
     @deprecated(deprecated_in="0.11", removed_in="0.13", current_version=__version__)
     def submit_operations(self, operations, _id=None, env=None, parallel=False, flags=None,
@@ -2781,7 +4405,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
 
     def submit(self, bundle_size=1, jobs=None, names=None, num=None, parallel=False,
                force=False, walltime=None, env=None, ignore_conditions=IgnoreConditions.NONE,
-               ignore_conditions_on_execution=IgnoreConditions.NONE, **kwargs):
+               ignore_conditions_on_execution=IgnoreConditions.NONE, num_workers=None,
+               collapse=False, **kwargs):
         """Submit function for the project's main submit interface.
 
         :param bundle_size:
@@ -2820,6 +4445,18 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             submitting. The default is :py:class:`IgnoreConditions.NONE`.
         :type ignore_conditions:
             :py:class:`~.IgnoreConditions`
+        :param num_workers:
+            Place all operations into one work queue and submit this number of cluster
+            jobs, each of which runs a worker that drains the queue, instead of submitting
+            the operations in bundles. The bundle_size is ignored in this case.
+        :type num_workers:
+            int
+        :param collapse:
+            Execute the same operation or group for multiple jobs of a bundle with a
+            single command and therefore within one interpreter. Operations that are
+            forked, executed with MPI, or executed in parallel are not collapsed.
+        :type collapse:
+            bool
         """
         # Regular argument checks and expansion
         if jobs is None:
@@ -2846,6 +4483,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 "The ignore_conditions argument of FlowProject.run() "
                 "must be a member of class IgnoreConditions")
 
+        # Use the most recent scheduler status, if polled in the background.
+        self._publish_scheduler_status()
+
         # Gather all pending operations.
         with self._potentially_buffered():
             default_directives = self._get_default_directives()
@@ -2855,13 +4495,34 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         if num is not None:
             operations = list(islice(operations, num))
 
-        # Bundle them up and submit.
-        for bundle in _make_bundles(operations, bundle_size):
-            status = self._submit_operations(operations=bundle, env=env, parallel=parallel,
-                                             force=force, walltime=walltime, **kwargs)
+        if num_workers is None:
+            # Bundle them up and submit.
+            bundles = ((None, bundle) for bundle in _make_bundles(operations, bundle_size))
+        else:
+            # Queue them up and submit the workers.
+            operations = list(operations)
+            if not operations:
+                return
+            queue_id = self._enqueue_operations(operations, pretend=kwargs.get('pretend'))
+            kwargs['work_queue'] = self._worker_cmd(operations[0], queue_id, walltime)
+            bundles = [(self._store_bundled(operations), operations)] * num_workers
+        for bundle, status in self._submit_bundles(bundles, env=env, parallel=parallel,
+                                                   force=force, walltime=walltime,
+                                                   collapse=collapse, **kwargs):
             if status is not None:  # operations were submitted, store status
                 for operation in bundle:
                     operation.set_status(status)
+                # Scheduler status queried before this submission is outdated.
+                self._scheduler_status_timestamp = time.time()
+
+    def _worker_cmd(self, operation, queue_id, walltime=None):
+        "Return the command that starts a worker for the given work queue."
+        entrypoint = self._groups[operation.name]._determine_entrypoint(
+            self._entrypoint, dict(), operation.job)
+        cmd = '{} worker {}'.format(entrypoint, queue_id)
+        if walltime is not None:
+            cmd += ' --walltime {}'.format(walltime.total_seconds() / 3600)
+        return cmd
 
     @classmethod
     def _add_submit_args(cls, parser):
@@ -2911,6 +4572,10 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             '-p', '--parallel',
             action='store_true',
             help="Execute all operations in parallel.")
+        execution_group.add_argument(
+            '--collapse',
+            action='store_true',
+            help="Execute the same operation for multiple jobs with a single command.")
         cls._add_direct_cmd_arg_group(parser)
         cls._add_template_arg_group(parser)
 
@@ -3003,6 +4668,17 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             '-p', '--parallel',
             action='store_true',
             help="Execute all operations in a single bundle in parallel.")
+        bundling_group.add_argument(
+            '--num-workers',
+            type=_positive_int,
+            help="Place all operations into one work queue and submit the given number "
+                 "of scheduler jobs, each running a worker that executes operations "
+                 "from the queue until it is empty.")
+        bundling_group.add_argument(
+            '--collapse',
+            action='store_true',
+            help="Execute the same operation for multiple jobs of a bundle with a single "
+                 "command, unless the operations are executed in parallel.")
 
     @classmethod
     def _add_direct_cmd_arg_group(cls, parser):
@@ -3020,13 +4696,69 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             help="Manually specify all labels that are required for the direct command "
                  "to be considered eligible for execution.")
 
-    def export_job_statuses(self, collection, statuses):
-        "Export the job statuses to a database collection."
-        for status in statuses:
-            job = self.open_job(id=status['job_id'])
-            status['statepoint'] = job.statepoint()
-            collection.update_one({'_id': status['job_id']},
-                                  {'$set': status}, upsert=True)
+    def export_job_statuses(self, collection, statuses=None, batch_size=1000,
+                            incremental=False):
+        """Export the job statuses to a database collection.
+
+        The statuses are upserted in batches: with a single ``bulk_write`` per batch
+        for MongoDB collections, with ``update`` for a :class:`signac.Collection`,
+        which replaces existing documents, and with ``update_one`` otherwise.
+
+        :param collection:
+            The collection to which the statuses are exported.
+        :type collection:
+            A :class:`pymongo.collection.Collection`, a :class:`signac.Collection`, or
+            any other collection with an ``update_one`` method.
+        :param statuses:
+            The statuses to export as returned by :meth:`~.get_job_status`. If omitted,
+            the status of all jobs is determined and exported in batches.
+        :type statuses:
+            iterable of dict
+        :param batch_size:
+            The number of statuses upserted at once, all statuses if None.
+        :type batch_size:
+            int
+        :param incremental:
+            Only write statuses that changed since the last export, as determined by
+            a hash of the status that is stored with each exported document.
+        :type incremental:
+            bool
+        """
+        if statuses is None:
+            statuses = self._generate_status(
+                self, sys.stderr, ignore_errors=False,
+                status_parallelization=self.config['flow']['status_parallelization'])
+
+        def _documents():
+            for status in statuses:
+                job = self.open_job(id=status['job_id'])
+                doc = dict(status, statepoint=job.statepoint())
+                # The hash is always stored, such that it is never outdated by an
+                # export that is not incremental. A previously stored hash is ignored.
+                doc.pop('_status_hash', None)
+                doc['_status_hash'] = sha1(
+                    json.dumps(doc, sort_keys=True).encode()).hexdigest()
+                yield doc
+
+        for batch in _make_bundles(_documents(), batch_size):
+            if incremental:
+                exported = _get_exported_status_hashes(
+                    collection, [status['job_id'] for status in batch])
+                batch = [status for status in batch
+                         if exported.get(status['job_id']) != status['_status_hash']]
+            if not batch:
+                continue
+            if hasattr(collection, 'bulk_write'):
+                from pymongo import UpdateOne
+                collection.bulk_write(
+                    [UpdateOne({'_id': status['job_id']}, {'$set': status}, upsert=True)
+                     for status in batch], ordered=False)
+            elif isinstance(collection, signac.Collection):
+                collection.update(dict(status, _id=status['job_id']) for status in batch)
+            else:
+                for status in batch:
+                    collection.update_one({'_id': status['job_id']},
+                                          {'$set': status}, upsert=True)
 
     @classmethod
     def _add_print_status_args(cls, parser):
@@ -3110,36 +4842,129 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                  "Please use the status_parallelization configuration "
                  "instead (see above)."
             )
+        page_group = parser.add_argument_group(
+            'page',
+            "Show the status of a page of the selected jobs. The filters are only "
+            "evaluated until the page is filled and the overview only covers the page.")
+        page_group.add_argument(
+            '--offset',
+            type=_nonnegative_int,
+            default=0,
+            help="Skip this many of the selected jobs.")
+        page_group.add_argument(
+            '--limit',
+            type=_positive_int,
+            help="Show the status of at most this many jobs.")
+        page_group.add_argument(
+            '--sort-by',
+            type=str,
+            metavar='KEY',
+            help="Sort the jobs by 'job_id' or by a (dot-separated) state point key. "
+                 "Sorting by a status field, e.g., a label, is not supported.")
+        page_group.add_argument(
+            '--with-eligible',
+            type=str,
+            dest='with_eligible_operation',
+            metavar='OPERATION',
+            help="Only show jobs for which this operation or group is eligible.")
+        page_group.add_argument(
+            '--with-label',
+            type=str,
+            metavar='LABEL',
+            help="Only show jobs with this label.")
         view_group.add_argument(
             '-o', '--output-format',
             type=str,
             default='terminal',
-            help="Set status output format: terminal, markdown, or html.")
+            help="Set status output format: terminal, markdown, html, or jsonl (one line "
+                 "of JSON per job, written as soon as the status of the job is determined).")
+        view_group.add_argument(
+            '--columnar',
+            action='store_true',
+            help="Collect the status in NumPy arrays and aggregate the overview with "
+                 "array reductions (requires numpy).")
+        view_group.add_argument(
+            '--stream',
+            action='store_true',
+            help="Print the detailed view row by row while the job status is determined, "
+                 "followed by the overview. Tables are not aligned in this mode.")
 
     def labels(self, job):
         """Yields all labels for the given ``job``.
 
         See also: :meth:`~.label`
         """
-        for label_func, label_name in self._label_functions.items():
-            if label_name is None:
-                label_name = getattr(label_func, '_label_name',
-                                     getattr(label_func, '__name__', type(label_func).__name__))
+        if self._label_cache is None:
+            yield from self._evaluate_labels(job)
+            return
+        job_id = str(job)
+        try:
+            labels = self._label_cache[job_id]
+        except KeyError:
+            labels = self._label_cache[job_id] = tuple(self._evaluate_labels(job))
+        yield from labels
+
+    def _evaluate_labels(self, job):
+        "Evaluate all label functions for job and accumulate the time spent in each."
+        for label_name, label_func in self._bound_label_functions:
+            start = time.perf_counter()
             try:
                 label_value = label_func(job)
-            except TypeError:
-                try:
-                    label_value = label_func(self, job)
-                except Exception:
-                    label_func = getattr(self, label.__func__.__name__)
-                    label_value = label_func(job)
-
-            assert label_name is not None
+            finally:
+                elapsed = time.perf_counter() - start
+                instrumentation._record('labels', label_name, elapsed)
+                with self._label_timings_lock:
+                    timing = self._label_timings[label_name]
+                    timing[0] += 1
+                    timing[1] += elapsed
             if isinstance(label_value, str):
                 yield label_value
             elif bool(label_value) is True:
                 yield label_name
 
+    @contextlib.contextmanager
+    def _memoized_labels(self):
+        """Memoize the labels of each job within this context, e.g., one status pass.
+
+        The time spent in each label function within the context is logged at the
+        end of the context. Labels that are evaluated in other processes, e.g.,
+        with process parallelization, are not included in the timings.
+        """
+        if self._label_cache is not None:   # already within a status pass
+            yield
+            return
+        self._label_cache = dict()
+        self._label_timings.clear()
+        try:
+            yield
+        finally:
+            self._label_cache = None
+            self._log_label_timings()
+
+    def _log_label_timings(self):
+        "Log the number of calls of and the cumulative time spent in each label function."
+        for label_name, (num_calls, elapsed) in self.label_timings().items():
+            logger.info("Label '{}': {} call(s) in {:.3f}s.".format(
+                label_name, num_calls, elapsed))
+
+    def label_timings(self):
+        """Return the number of calls of and the cumulative time spent in each label function.
+
+        The timings are accumulated while determining the labels of jobs, e.g., with
+        :meth:`~.labels`, and are reset at the beginning of every status pass, e.g.,
+        by :meth:`~.print_status`. Labels that are evaluated in other processes are
+        not included.
+
+        :return:
+            A dict mapping the label names to tuples of the number of calls and the
+            cumulative time in seconds, ordered by decreasing time.
+        :rtype:
+            dict
+        """
+        with self._label_timings_lock:
+            timings = sorted(self._label_timings.items(), key=lambda item: -item[1][1])
+            return OrderedDict((name, tuple(timing)) for name, timing in timings)
+
     def add_operation(self, name, cmd, pre=None, post=None, **kwargs):
         """
         Add an operation to the workflow.
@@ -3213,6 +5038,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         self._groups[name] = FlowGroup(name,
                                        operations={name: op},
                                        operation_directives=dict(name=kwargs))
+        self._update_group_overlaps()
 
     def completed_operations(self, job):
         """Determine which operations have been completed for job.
@@ -3432,6 +5258,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                                                                           '_flow_directives',
                                                                           dict())
 
+        self._update_group_overlaps()
+
     @property
     def operations(self):
         "The dictionary of operations that have been added to the workflow."
@@ -3441,22 +5269,63 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
     def groups(self):
         return self._groups
 
-    def _eligible_for_submission(self, flow_group, job):
+    def _update_group_overlaps(self):
+        """Index which groups share operations with each other.
+
+        Every group is assigned one bit. The overlap mask of a group has the bits of
+        all groups set that share at least one operation with it, including itself.
+        """
+        self._group_bits = {name: 1 << i for i, name in enumerate(self._groups)}
+        self._group_overlap_masks = dict()
+        for name, group in self._groups.items():
+            mask = self._group_bits[name]
+            for other_name, other_group in self._groups.items():
+                if not group.isdisjoint(other_group):
+                    mask |= self._group_bits[other_name]
+            self._group_overlap_masks[name] = mask
+
+    def _get_active_groups_mask(self, job, cached_status):
+        """Return a bit mask of all groups that are submitted, queued, or running for job.
+
+        :param job:
+            The signac job handle.
+        :type job:
+            :class:`~signac.contrib.job.Job`
+        :param cached_status:
+            The scheduler status as stored in the project document.
+        :type cached_status:
+            dict
+        :return:
+            The bit mask of active groups, see also :meth:`~._update_group_overlaps`.
+        :rtype:
+            int
+        """
+        mask = 0
+        if cached_status:   # Without any stored status there are no active groups.
+            for name, group in self._groups.items():
+                status = cached_status.get(group._generate_id(job), JobStatus.unknown)
+                if status >= JobStatus.submitted:
+                    mask |= self._group_bits[name]
+        return mask
+
+    def _eligible_for_submission(self, flow_group, job, active_groups=None):
         """Determine if a flow_group is eligible for submission with a given job.
 
         By default, an operation is eligible for submission when it
         is not considered active, that means already queued or running.
+
+        :param active_groups:
+            The bit mask of active groups for this job, as returned by
+            :meth:`~._get_active_groups_mask`. Determined from the project
+            document if omitted.
+        :type active_groups:
+            int
         """
         if flow_group is None or job is None:
             return False
-        if flow_group._get_status(job) >= JobStatus.submitted:
-            return False
-        group_ops = set(flow_group)
-        for other_group in self._groups.values():
-            if group_ops & set(other_group):
-                if other_group._get_status(job) >= JobStatus.submitted:
-                    return False
-        return True
+        if active_groups is None:
+            active_groups = self._get_active_groups_mask(job, self._get_cached_status())
+        return not active_groups & self._group_overlap_masks[flow_group.name]
 
     def _main_status(self, args):
         "Print status overview."
@@ -3464,10 +5333,14 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         if args.compact and not args.unroll:
             logger.warn("The -1/--one-line argument is incompatible with "
                         "'--stack' and will be ignored.")
+        if args.with_eligible_operation is not None and \
+                args.with_eligible_operation not in self._groups:
+            raise ValueError(
+                "Unknown operation or group '{}'.".format(args.with_eligible_operation))
         show_traceback = args.debug or args.show_traceback
         args = {key: val for key, val in vars(args).items()
                 if key not in ['func', 'verbose', 'debug', 'show_traceback',
-                               'job_id', 'filter', 'doc_filter']}
+                               'job_id', 'filter', 'doc_filter', 'stats']}
         if args.pop('full'):
             args['detailed'] = args['all_ops'] = True
 
@@ -3497,7 +5370,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 print(
                     "WARNING: "
                     "The status compilation took more than {}s per job. Consider "
-                    "using `--profile` to determine bottlenecks within your project "
+                    "using `--stats` or `--profile` to determine bottlenecks within your project "
                     "workflow definition.\n"
                     "Execute `signac config set flow.{} VALUE` to specify the "
                     "warning threshold in seconds.\n"
@@ -3526,7 +5399,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                                 np=args.parallel, timeout=args.timeout, num=args.num,
                                 num_passes=args.num_passes, progress=args.progress,
                                 order=args.order,
-                                ignore_conditions=args.ignore_conditions)
+                                ignore_conditions=args.ignore_conditions,
+                                target=args.target)
 
         if args.switch_to_project_root:
             with add_cwd_to_environment_pythonpath():
@@ -3564,7 +5438,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         # Generate the script and print to screen.
         print(self._script(
             operations=operations, parallel=args.parallel,
-            template=args.template, show_template_help=args.show_template_help))
+            template=args.template, show_template_help=args.show_template_help,
+            collapse=args.collapse))
 
     def _main_submit(self, args):
         "Submit jobs to a scheduler"
@@ -3606,6 +5481,10 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             for job in jobs:
                 operation_function(job)
 
+    def _main_worker(self, args):
+        "Execute operations from a work queue."
+        self._run_work_queue(args.queue_id, walltime=args.walltime, timeout=args.timeout)
+
     def _select_jobs_from_args(self, args):
         "Select jobs with the given command line arguments ('-j/-f/--doc-filter')."
         if args.job_id and (args.filter or args.doc_filter):
@@ -3648,9 +5527,14 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         # Find file that main is called in. When running through the command
         # line interface, we know exactly what the entrypoint path should be:
         # it's the file where main is called, which we can pull off the stack.
-        self._entrypoint.setdefault('path', os.path.realpath(inspect.stack()[-1].filename))
+        self._entrypoint.setdefault('path', os.path.realpath(_get_outermost_filename()))
 
         if parser is None:
+            # Scripts execute each operation with the exec command, so this command is
+            # handled without constructing the full command line interface.
+            args = self._parse_exec_args(sys.argv[1:])
+            if args is not None:
+                return self._main_call(args)
             parser = argparse.ArgumentParser()
 
         base_parser = argparse.ArgumentParser(add_help=False)
@@ -3696,6 +5580,11 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                  "Optionally provide a filename pattern to select for what files "
                  "to show result for. Defaults to the main module. "
                  "(requires pprofile)")
+        parser_status.add_argument(
+            '--stats',
+            action='store_true',
+            help="Print counters and timers of the condition evaluations, label calls, "
+                 "and other hot paths of the status determination as JSON to stderr.")
         parser_status.set_defaults(func=self._main_status)
 
         parser_next = subparsers.add_parser(
@@ -3750,9 +5639,16 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         execution_group.add_argument(
             '--order',
             type=str,
-            choices=['none', 'by-job', 'cyclic', 'random'],
+            choices=['none', 'by-job', 'cyclic', 'random', 'pipeline'],
             default=None,
             help="Specify the execution order of operations for each execution pass.")
+        execution_group.add_argument(
+            '--until',
+            type=str,
+            dest='target',
+            choices=list(sorted(self._operations)),
+            help="Execute only the given operation and the operations it depends on, "
+                 "as determined from the pre- and post-conditions.")
         execution_group.add_argument(
             '--ignore-conditions',
             type=str,
@@ -3760,6 +5656,11 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             default=IgnoreConditions.NONE,
             action=_IgnoreConditionsConversion,
             help="Specify conditions to ignore for eligibility check.")
+        parser_run.add_argument(
+            '--stats',
+            action='store_true',
+            help="Print counters and timers of the condition evaluations, operation "
+                 "executions, and other hot paths of the execution as JSON to stderr.")
         parser_run.set_defaults(func=self._main_run)
 
         parser_script = subparsers.add_parser(
@@ -3793,6 +5694,12 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         env_group = parser_submit.add_argument_group(
             '{} options'.format(self._environment.__name__))
         self._environment.add_args(env_group)
+        parser_submit.add_argument(
+            '--stats',
+            action='store_true',
+            help="Print counters and timers of the condition evaluations, scheduler "
+                 "queries, template renders, and other hot paths of the submission "
+                 "as JSON to stderr.")
         parser_submit.set_defaults(func=self._main_submit)
         print('Using environment configuration:', self._environment.__name__, file=sys.stderr)
 
@@ -3813,6 +5720,25 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                  "Omit to default to all statepoints.")
         parser_exec.set_defaults(func=self._main_exec)
 
+        parser_worker = subparsers.add_parser(
+            'worker',
+            parents=[base_parser],
+            description="Execute operations from a work queue until it is empty.")
+        parser_worker.add_argument(
+            'queue_id',
+            type=str,
+            help="The id of the work queue.")
+        parser_worker.add_argument(
+            '-w', '--walltime',
+            type=float,
+            help="The walltime of the cluster job in hours. No further operations are "
+                 "started when the walltime is about to expire.")
+        parser_worker.add_argument(
+            '-t', '--timeout',
+            type=int,
+            help="A timeout in seconds after which the execution of one operation is canceled.")
+        parser_worker.set_defaults(func=self._main_worker)
+
         args = parser.parse_args()
         if not hasattr(args, 'func'):
             parser.print_usage()
@@ -3842,6 +5768,33 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             if args.parameters is not None and len(args.parameters) == 0:
                 args.parameters = self.PRINT_STATUS_ALL_VARYING_PARAMETERS
 
+        self._main_call(args)
+
+    def _parse_exec_args(self, argv):
+        """Parse the arguments of the exec command without the full command line interface.
+
+        Only the plain form ``exec <operation> [<jobid> ...]`` used within scripts is
+        handled. Neither the compute environment is detected, nor are any of the other
+        subcommands constructed.
+
+        :param argv:
+            The command line arguments without the program name.
+        :type argv:
+            list
+        :returns:
+            The parsed arguments or None if the command line must be parsed by the
+            full command line interface.
+        """
+        if len(argv) < 2 or argv[0] != 'exec' or argv[1] not in self._operations:
+            return None
+        if any(arg.startswith('-') for arg in argv[1:]):
+            return None
+        return argparse.Namespace(
+            func=self._main_exec, operation=argv[1], jobid=argv[2:], verbose=0, debug=False,
+            show_traceback=bool(flow_config.get_config_value('show_traceback')))
+
+    def _main_call(self, args):
+        "Call the function of a parsed subcommand and handle any raised errors."
         # Set verbosity level according to the `-v` argument.
         logging.basicConfig(level=max(0, logging.WARNING - 10 * args.verbose))
 
@@ -3860,7 +5813,12 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             sys.exit(1)
 
         try:
-            args.func(args)
+            if getattr(args, 'stats', False):
+                with instrumentation.collect_stats() as stats:
+                    args.func(args)
+                stats.dump_json(sys.stderr, indent=4)
+            else:
+                args.func(args)
         except NoSchedulerError as error:
             print("ERROR: {}".format(error),
                   "Consider to use the 'script' command to generate an execution script instead.",
@@ -3873,7 +5831,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             print("Error: Failed to complete execution due to "
                   "timeout ({}s).".format(args.timeout), file=sys.stderr)
             _show_traceback_and_exit(error)
-        except Jinja2TemplateNotFound as error:
+        except _template_not_found_error() as error:
             print("Did not find template script '{}'.".format(error), file=sys.stderr)
             _show_traceback_and_exit(error)
         except AssertionError as error:
@@ -3898,12 +5856,28 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             _show_traceback_and_exit(error)
 
 
+def _get_outermost_filename():
+    "Return the filename of the outermost frame of the call stack."
+    # Equivalent to inspect.stack()[-1].filename, without reading the source context
+    # of every frame.
+    frame = inspect.currentframe()
+    while frame.f_back is not None:
+        frame = frame.f_back
+    return frame.f_code.co_filename
+
+
 def _execute_serialized_operation(loads, project, operation):
     """Invoke the _execute_operation() method on a serialized project instance."""
     project = loads(project)
     project._execute_operation(project._loads_op(operation))
 
 
+def _execute_serialized_pipeline(loads, project, job_id, kwargs):
+    """Invoke the _run_pipeline() method on a serialized project instance."""
+    project = loads(project)
+    return project._run_pipeline(project.open_job(id=job_id), **kwargs)
+
+
 def _serialized_get_job_status(s_task):
     """Invoke the _get_job_status() method on a serialized project instance."""
     loads = s_task[0]
@@ -3911,7 +5885,8 @@ def _serialized_get_job_status(s_task):
     job = project.open_job(id=s_task[2])
     ignore_errors = s_task[3]
     cached_status = s_task[4]
-    return project.get_job_status(job, ignore_errors=ignore_errors, cached_status=cached_status)
+    get_job_status = getattr(project, s_task[5])
+    return get_job_status(job, ignore_errors=ignore_errors, cached_status=cached_status)
 
 
 # Status-related helper functions
@@ -1,8 +1,140 @@
 # make separate python class for render_status
+import re
+from functools import lru_cache
+
 from tqdm import tqdm
 from .util import mistune
+from .util import instrumentation
+from .util.mistune.plugins.tabulate import tabulate
 from .scheduling.base import JobStatus
 
+try:
+    from wcwidth import wcswidth    # optional wide-character (CJK) support
+except ImportError:
+    wcswidth = None
+
+
+_MARKDOWN_STRONG = re.compile(r'\*\*(.+?)\*\*')
+
+# Types of table cells, ordered from the least to the most generic type.
+_BOOL, _INT, _FLOAT, _TEXT = range(4)
+
+# ANSI color codes, which do not contribute to the width of a table cell.
+_ANSI_CODES = re.compile(r"\x1b\[\d+[;\d]*m|\x1b\[\d*\;\d*\;\d*m")
+
+# The minimal padding of table columns with respect to the width of the header.
+_MIN_PADDING = 2
+
+try:
+    _isascii = str.isascii
+except AttributeError:  # Python < 3.7
+    def _isascii(s):
+        return all(ord(c) < 128 for c in s)
+
+
+def _cell_type(cell):
+    "Return the least generic type of a table cell as determined by tabulate."
+    if cell in ('True', 'False'):
+        return _BOOL
+    try:
+        int(cell)
+        return _INT
+    except ValueError:
+        pass
+    try:
+        float(cell)
+        return _FLOAT
+    except ValueError:
+        return _TEXT
+
+
+def _format_table(headers, rows):
+    """Generate the lines of a table with fixed-width columns.
+
+    The output is identical to the 'simple' table format of the vendored tabulate
+    module, which is used by the terminal markdown renderer, but the type and width
+    of all columns are determined in a single pass over the cells. Columns of
+    integers are aligned to the right and all other columns to the left. Missing
+    cells at the end of a row are left empty and columns without any cell are
+    omitted. The cells are expected to be stripped of surrounding whitespace.
+    ANSI color codes do not contribute to the width of a cell and wide characters
+    are accounted for if the wcwidth package is available.
+
+    Only tables as generated for the status output are formatted directly, tables
+    with floating point columns or rows that are longer than the headers are
+    rendered with tabulate instead.
+
+    :param headers:
+        The column headers.
+    :type headers:
+        list of str
+    :param rows:
+        The rows of table cells.
+    :type rows:
+        list of lists of str
+    :yields:
+        The lines of the table.
+    """
+    num_columns = max(map(len, rows), default=0)
+    if not rows or num_columns > len(headers):
+        yield from tabulate(rows, headers=headers).split('\n')
+        return
+    headers = headers[:num_columns]     # like tabulate, omit columns without cells
+
+    def width(cell):
+        if '\x1b' in cell:
+            cell = _ANSI_CODES.sub('', cell)
+        if wcswidth is None or (_isascii(cell) and cell.isprintable()):
+            return len(cell)
+        return wcswidth(cell)
+
+    types = [_BOOL] * num_columns
+    col_widths = [width(header) + _MIN_PADDING for header in headers]
+    cell_widths = []
+    for row in rows:
+        row_widths = list(map(width, row))
+        cell_widths.append(row_widths)
+        for i, (cell, cell_width) in enumerate(zip(row, row_widths)):
+            if cell_width > col_widths[i]:
+                col_widths[i] = cell_width
+            if types[i] != _TEXT:
+                if '\x1b' in cell:
+                    cell = _ANSI_CODES.sub('', cell)
+                types[i] = max(types[i], _cell_type(cell))
+    if _FLOAT in types:
+        yield from tabulate(rows, headers=headers).split('\n')
+        return
+
+    right = [t == _INT for t in types]
+
+    def pad(cells, widths):
+        missing = num_columns - len(cells)
+        if missing:
+            cells = cells + [''] * missing
+            widths = widths + [0] * missing
+        return '  '.join(
+            ' ' * (w - cw) + cell if r else cell + ' ' * (w - cw)
+            for cell, cw, w, r in zip(cells, widths, col_widths, right)).rstrip()
+
+    yield pad(headers, list(map(width, headers)))
+    yield '  '.join('-' * w for w in col_widths).rstrip()
+    for row, row_widths in zip(rows, cell_widths):
+        yield pad(row, row_widths)
+
+
+class _TerminalRenderer(mistune.TerminalRenderer):
+    "Terminal markdown renderer that formats tables with :func:`_format_table`."
+
+    def table(self, text):
+        rows = [[self.modify_strong(cell) for cell in row] for row in text['rows']]
+        return '\n'.join(_format_table(text['headers'], rows)) + self.linebreak() * 2
+
+
+@lru_cache(maxsize=1)
+def _terminal_markdown():
+    "Return the markdown parser for the terminal output of the status."
+    return mistune.Markdown(_TerminalRenderer(), plugins=[mistune.PLUGINS['table']])
+
 
 class Renderer:
     """A class for rendering status in different format.
@@ -25,7 +157,7 @@ class Renderer:
             str
         """
 
-        self.terminal_output = mistune.terminal(self.markdown_output)
+        self.terminal_output = _terminal_markdown()(self.markdown_output)
         return self.terminal_output
 
     def generate_html_output(self):
@@ -79,6 +211,64 @@ class Renderer:
             str
         """
 
+        template = self._get_template(template, template_environment, detailed, expand,
+                                      unroll, compact)
+        with instrumentation._timer('template_renders', template.name):
+            self.markdown_output = template.render(**context)
+            if output_format == 'terminal':
+                return self.generate_terminal_output()
+            elif output_format == 'markdown':
+                return self.markdown_output
+            elif output_format == 'html':
+                return self.generate_html_output()
+            else:
+                raise ValueError('Output format not supported, valid options are '
+                                 'terminal, markdown, or html.')
+
+    def stream(self, template, template_environment, context, detailed, expand,
+               unroll, compact, output_format, file):
+        """Render the status for print_status and write it line by line while rendering.
+
+        The jobs of the context may be an iterator, which is only consumed while the
+        rows of the detailed view are rendered. Since the output is not converted as a
+        whole, the columns of tables are not aligned.
+
+        :param file:
+            The file to which the status is written.
+        :type file:
+            file-like object
+
+        See :meth:`~.render` for the remaining parameters; the output format
+        must be either 'terminal' or 'markdown'.
+        """
+        if output_format == 'terminal':
+            def convert(line):
+                return _MARKDOWN_STRONG.sub('\033[1m\\1\033[0m', line)
+        elif output_format == 'markdown':
+            def convert(line):
+                return line
+        else:
+            raise ValueError('Output format not supported for streaming, valid options are '
+                             'terminal or markdown.')
+
+        template = self._get_template(template, template_environment, detailed, expand,
+                                      unroll, compact)
+        # The rendering is interleaved with the status determination of the jobs,
+        # hence only the number of renders is recorded, not the time.
+        instrumentation._record('template_renders', template.name)
+        buffer = ''
+        for chunk in template.generate(**context):
+            buffer += chunk
+            if '\n' in buffer:
+                *lines, buffer = buffer.split('\n')
+                file.write(''.join(convert(line) + '\n' for line in lines))
+                file.flush()
+        if buffer:
+            file.write(convert(buffer) + '\n')
+            file.flush()
+
+    def _get_template(self, template, template_environment, detailed, expand, unroll, compact):
+        "Return the status template with all filters required for rendering."
         # use Jinja2 template for status output
         if template is None:
             if detailed and expand:
@@ -182,15 +372,4 @@ class Renderer:
         template_environment.filters['draw_progressbar'] = draw_progressbar
         template_environment.filters['get_operation_status'] = get_operation_status
         template_environment.filters['job_filter'] = job_filter
-
-        template = template_environment.get_template(template)
-        self.markdown_output = template.render(**context)
-        if output_format == 'terminal':
-            return self.generate_terminal_output()
-        elif output_format == 'markdown':
-            return self.markdown_output
-        elif output_format == 'html':
-            return self.generate_html_output()
-        else:
-            raise ValueError('Output format not supported, valid options are '
-                             'terminal, markdown, or html.')
+        return template_environment.get_template(template)
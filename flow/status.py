@@ -0,0 +1,216 @@
+# Copyright (c) 2020 The Regents of the University of Michigan
+# All rights reserved.
+# This software is licensed under the BSD 3-Clause License.
+"""Columnar representation of the status of many jobs.
+
+This module requires NumPy and is only imported when the columnar status
+is requested, e.g., with ``FlowProject.print_status(columnar=True)``.
+"""
+import json
+from array import array
+from collections import OrderedDict
+
+import numpy as np
+
+from .scheduling.base import JobStatus
+
+
+def _to_job_status(code):
+    "Convert a stored scheduler status code back to a JobStatus if possible."
+    code = int(code)
+    try:
+        return JobStatus(code)
+    except ValueError:   # user defined status
+        return code
+
+
+class _ColumnarStatus:
+    """The status of many jobs stored in arrays instead of one dict per job.
+
+    The status of the operations is stored in a job by operation matrix of
+    scheduler status codes and a matrix of bit flags that mark whether an operation
+    status was determined, is eligible, or is completed. The labels are stored in a
+    job by label boolean matrix. Iterating over the columnar status yields
+    lightweight row views, which support the same item access as the dicts
+    returned by :meth:`~.FlowProject.get_job_status`, such that they can be
+    consumed by the status templates.
+
+    :param statuses:
+        The status dicts of the jobs as returned by :meth:`~.FlowProject.get_job_status`.
+        Every status dict is only accessed once and not referenced afterwards.
+    :type statuses:
+        iterable of dict
+    :param operations:
+        The names of all operations, in the order of the operation columns.
+    :type operations:
+        sequence of str
+    """
+
+    PRESENT = 1
+    ELIGIBLE = 2
+    COMPLETED = 4
+
+    def __init__(self, statuses, operations):
+        self.operations = list(operations)
+        op_index = {name: i for i, name in enumerate(self.operations)}
+        label_index = dict()
+        num_operations = len(self.operations)
+
+        self.job_ids = []
+        self.operations_errors = []
+        self.labels_errors = []
+        codes = array('i')
+        flags = array('B')
+        label_rows = array('l')
+        label_cols = array('l')
+        for row, status in enumerate(statuses):
+            self.job_ids.append(status['job_id'])
+            self.operations_errors.append(status['_operations_error'])
+            self.labels_errors.append(status['_labels_error'])
+            job_codes = [0] * num_operations
+            job_flags = [0] * num_operations
+            for name, op_status in status['operations'].items():
+                i = op_index[name]
+                job_codes[i] = op_status['scheduler_status']
+                job_flags[i] = self.PRESENT | \
+                    (self.ELIGIBLE if op_status['eligible'] else 0) | \
+                    (self.COMPLETED if op_status['completed'] else 0)
+            codes.extend(job_codes)
+            flags.extend(job_flags)
+            for label in status['labels']:
+                label_rows.append(row)
+                label_cols.append(label_index.setdefault(label, len(label_index)))
+
+        num_jobs = len(self.job_ids)
+        self.scheduler_status = np.frombuffer(codes, dtype=codes.typecode).reshape(
+            num_jobs, num_operations)
+        self.flags = np.frombuffer(flags, dtype=np.uint8).reshape(num_jobs, num_operations)
+
+        # Order the label columns by name, such that the labels of each row are sorted.
+        self.labels = sorted(label_index)
+        label_order = np.empty(len(label_index), dtype=int)
+        label_order[[label_index[label] for label in self.labels]] = np.arange(len(self.labels))
+        self.label_matrix = np.zeros((num_jobs, len(self.labels)), dtype=bool)
+        self.label_matrix[np.frombuffer(label_rows, dtype=label_rows.typecode),
+                          label_order[np.frombuffer(label_cols, dtype=label_cols.typecode)]
+                          ] = True
+
+        self.parameters = None
+        self.dummy_operation = False
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def __iter__(self):
+        return (_ColumnarStatusRow(self, i) for i in range(len(self)))
+
+    @property
+    def eligible(self):
+        "The job by operation matrix of eligible operations."
+        return (self.flags & self.ELIGIBLE).astype(bool)
+
+    @property
+    def errors(self):
+        "The set of unique errors that occurred while determining the status."
+        return set(filter(None, self.operations_errors + self.labels_errors))
+
+    def incomplete(self):
+        "Remove all jobs that do not have a single eligible operation."
+        mask = self.eligible.any(axis=1)
+        indices = np.flatnonzero(mask)
+        self.job_ids = [self.job_ids[i] for i in indices]
+        self.operations_errors = [self.operations_errors[i] for i in indices]
+        self.labels_errors = [self.labels_errors[i] for i in indices]
+        self.scheduler_status = self.scheduler_status[mask]
+        self.flags = self.flags[mask]
+        self.label_matrix = self.label_matrix[mask]
+        if self.parameters is not None:
+            self.parameters = [self.parameters[i] for i in indices]
+        return self
+
+    def label_counts(self):
+        "Return the number of jobs for each label that applies to any job."
+        counts = self.label_matrix.sum(axis=0)
+        return {label: int(n) for label, n in zip(self.labels, counts) if n}
+
+    def eligible_counts(self):
+        """Return the number of jobs for which each operation is eligible.
+
+        The operations are ordered by the first job for which they are eligible.
+        """
+        if not len(self):
+            return OrderedDict()
+        eligible = self.eligible
+        counts = eligible.sum(axis=0)
+        first = eligible.argmax(axis=0)
+        order = sorted(np.flatnonzero(counts), key=lambda i: (first[i], i))
+        return OrderedDict((self.operations[i], int(counts[i])) for i in order)
+
+    def dump_json(self, file):
+        """Write the status of all jobs to file as a JSON object keyed by job id.
+
+        The output is identical to dumping the equivalent dict of status dicts
+        with an indentation of 4, but only one job status is converted at a time.
+        """
+        file.write('{')
+        for i, row in enumerate(self):
+            encoded = json.dumps(row.to_dict(), indent=4).replace('\n', '\n    ')
+            file.write('{}\n    {}: {}'.format(
+                ',' if i else '', json.dumps(row['job_id']), encoded))
+        file.write('\n}\n' if len(self) else '}\n')
+
+
+class _ColumnarStatusRow:
+    """A view of the status of a single job of a :class:`_ColumnarStatus`.
+
+    The operations mapping is only created on first access and then kept for the
+    lifetime of the view, since templates usually access it more than once per job.
+    """
+
+    __slots__ = ('_status', '_row', '_operations')
+
+    _KEYS = ('job_id', 'operations', '_operations_error', 'labels', '_labels_error')
+
+    def __init__(self, status, row):
+        self._status = status
+        self._row = row
+        self._operations = None
+
+    def _get_operations(self):
+        status, row = self._status, self._row
+        operations = OrderedDict()
+        for name, flags, code in zip(status.operations, status.flags[row].tolist(),
+                                     status.scheduler_status[row].tolist()):
+            if flags & status.PRESENT:
+                operations[name] = {
+                    'scheduler_status': _to_job_status(code),
+                    'eligible': bool(flags & status.ELIGIBLE),
+                    'completed': bool(flags & status.COMPLETED)}
+        if status.dummy_operation and not any(op['eligible'] for op in operations.values()):
+            operations[''] = {
+                'completed': False,
+                'eligible': False,
+                'scheduler_status': JobStatus.dummy}
+        return operations
+
+    def __getitem__(self, key):
+        status, row = self._status, self._row
+        if key == 'job_id':
+            return status.job_ids[row]
+        elif key == 'operations':
+            if self._operations is None:
+                self._operations = self._get_operations()
+            return self._operations
+        elif key == '_operations_error':
+            return status.operations_errors[row]
+        elif key == 'labels':
+            return [status.labels[i] for i in np.flatnonzero(status.label_matrix[row])]
+        elif key == '_labels_error':
+            return status.labels_errors[row]
+        elif key == 'parameters' and status.parameters is not None:
+            return status.parameters[row]
+        raise KeyError(key)
+
+    def to_dict(self):
+        "Return the status of the job as dict."
+        return {key: self[key] for key in self._KEYS}
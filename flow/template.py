@@ -10,7 +10,6 @@ import os
 import sys
 import errno
 import logging
-import jinja2
 
 
 logger = logging.getLogger(__name__)
@@ -43,6 +42,7 @@ def init(alias=None, template=None, root=None, out=None):
     if not project_class_name.endswith('Project'):
         project_class_name += 'Project'
 
+    import jinja2
     template_environment = jinja2.Environment(
         loader=jinja2.ChoiceLoader([
             jinja2.FileSystemLoader('templates'),
@@ -13,6 +13,16 @@ set -u
 
 cd {{ project.config.project_dir }}
 {% endblock %}
+{% if work_queue %}
+{% block work_queue %}
+
+# Execute the operations listed below from the work queue.
+{% for operation in operations %}
+# {{ "%s"|format(operation) }}
+{% endfor %}
+{{ work_queue }}
+{% endblock %}
+{% else %}
 {% block body %}
 {% set cmd_suffix = cmd_suffix|default('') ~ (' &' if parallel else '') %}
 {% for operation in operations %}
@@ -39,6 +49,7 @@ cd {{ project.config.project_dir }}
 {% endif %}
 {% endfor %}
 {% endblock %}
+{% endif %}
 {% block footer %}
 {% if parallel %}
 wait
@@ -2,6 +2,16 @@
 # All rights reserved.
 # This software is licensed under the BSD 3-Clause License.
 "Defines the API for the util sub package."
-from . import misc, translate, template_filters, mistune
+import importlib
+
+from . import misc, translate, template_filters
 
 __all__ = ['misc', 'translate', 'template_filters', 'mistune']
+
+
+def __getattr__(name):
+    # The mistune module is only required for rendering the status in markdown
+    # and is therefore imported upon first access (Python 3.7+).
+    if name == 'mistune':
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
@@ -17,6 +17,9 @@ show_traceback = boolean()
 eligible_jobs_max_lines = int(default=10)
 status_parallelization = string(default='thread')
 use_buffered_mode = boolean(default=True)
+scheduler_poll_interval = float(default=60)
+use_template_bytecode_cache = boolean(default=True)
+use_environment_cache = boolean(default=True)
 """
 
 
@@ -0,0 +1,173 @@
+# Copyright (c) 2020 The Regents of the University of Michigan
+# All rights reserved.
+# This software is licensed under the BSD 3-Clause License.
+"""Counters and timers for the hot paths of status determination, execution, and submission.
+
+Instrumentation is disabled by default, in which case the instrumented code paths
+only check whether a collector is active. Statistics are collected within the
+context of :func:`collect_stats`, for example:
+
+.. code-block:: python
+
+    with collect_stats() as stats:
+        project.print_status()
+    print(stats.to_dict()['conditions'])
+
+Events that occur in other processes, e.g., with process parallelization, are not
+collected.
+"""
+import json
+import threading
+import time
+from collections import defaultdict
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+# The active collector or None if instrumentation is disabled.
+_collector = None
+
+
+class Stats(object):
+    """Counters and timers of instrumented events grouped by category.
+
+    Every event is identified by a category, e.g., ``'conditions'``, and a name
+    within that category, e.g., the name of the condition function. For each event,
+    the number of occurrences and the cumulative time in seconds is recorded.
+    Events are recorded in the following categories:
+
+    ``conditions``
+        The evaluation of pre- and post-conditions, by condition.
+    ``labels``
+        The evaluation of label functions, by label.
+    ``document_reads``
+        The reads of the scheduler status from the project document.
+    ``id_generations``
+        The hashing of job-operation ids, by group.
+    ``scheduler_queries``
+        The queries of scheduler jobs, by scheduler.
+    ``template_renders``
+        The rendering of script and status templates, by template.
+    ``operations``
+        The execution of operations, by operation.
+    """
+
+    CATEGORIES = ('conditions', 'labels', 'document_reads', 'id_generations',
+                  'scheduler_queries', 'template_renders', 'operations')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = defaultdict(lambda: [0, 0.0])
+
+    def add(self, category, name, elapsed=0.0):
+        """Record one occurrence of an event.
+
+        :param category:
+            The category of the event.
+        :type category:
+            str
+        :param name:
+            The name of the event within its category.
+        :type name:
+            str
+        :param elapsed:
+            The time in seconds spent for the event.
+        :type elapsed:
+            float
+        """
+        with self._lock:
+            event = self._events[category, name]
+            event[0] += 1
+            event[1] += elapsed
+
+    def to_dict(self):
+        """Return the statistics as a nested dict.
+
+        :return:
+            A dict mapping every category to a dict that maps the event names to
+            dicts with the number of occurrences ``'count'`` and the cumulative
+            time ``'time'`` in seconds.
+        :rtype:
+            dict
+        """
+        result = OrderedDict((category, OrderedDict()) for category in self.CATEGORIES)
+        with self._lock:
+            events = sorted(self._events.items())
+        for (category, name), (count, elapsed) in events:
+            result.setdefault(category, OrderedDict())[name] = {
+                'count': count, 'time': elapsed}
+        return result
+
+    def dump_json(self, file, **kwargs):
+        "Write the statistics as JSON object to file."
+        json.dump(self.to_dict(), file, **kwargs)
+        file.write('\n')
+
+
+@contextmanager
+def collect_stats():
+    """Collect statistics of the instrumented code paths within this context.
+
+    Nested contexts do not share statistics, events are only recorded by the
+    innermost context.
+
+    :yields:
+        The :class:`Stats` instance that records all events within this context.
+    """
+    global _collector
+    previous = _collector
+    _collector = stats = Stats()
+    try:
+        yield stats
+    finally:
+        _collector = previous
+
+
+class _Timer(object):
+    "Record an event and the time spent within this context with a collector."
+
+    __slots__ = ('_collector', '_category', '_name', '_start')
+
+    def __init__(self, collector, category, name):
+        self._collector = collector
+        self._category = category
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._collector.add(self._category, self._name, time.perf_counter() - self._start)
+
+
+class _NullTimer(object):
+    "Context that does not record anything, used while instrumentation is disabled."
+
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def _timer(category, name):
+    """Return a context that records an event and the time spent within it.
+
+    The context is a no-op if instrumentation is disabled.
+    """
+    collector = _collector
+    if collector is None:
+        return _NULL_TIMER
+    return _Timer(collector, category, name)
+
+
+def _record(category, name, elapsed=0.0):
+    "Record an event with the active collector, if any."
+    collector = _collector
+    if collector is not None:
+        collector.add(category, name, elapsed)
@@ -9,6 +9,9 @@ from contextlib import contextmanager
 from itertools import cycle, islice
 
 
+logger = logging.getLogger(__name__)
+
+
 def _positive_int(value):
     """Expect a command line argument to be a positive integer.
 
@@ -30,6 +33,27 @@ def _positive_int(value):
     return ivalue
 
 
+def _nonnegative_int(value):
+    """Expect a command line argument to be a non-negative integer.
+
+    Designed to be used in conjunction with an argparse.ArgumentParser.
+
+    :param value:
+        This function will raise an argparse.ArgumentTypeError if value
+        is not a non-negative integer.
+    :raises:
+        :class:`argparse.ArgumentTypeError`
+    """
+    try:
+        ivalue = int(value)
+        if ivalue < 0:
+            raise argparse.ArgumentTypeError("Value must not be negative.")
+    except (TypeError, ValueError):
+        raise argparse.ArgumentTypeError(
+            "{} must be a non-negative integer.".format(value))
+    return ivalue
+
+
 def write_human_readable_statepoint(script, job):
     """Human-readable representation of a signac state point."""
     script.write('# Statepoint:\n#\n')
@@ -74,6 +98,29 @@ def redirect_log(job, filename='run.log', formatter=None, logger=None):
         logger.removeHandler(filehandler)
 
 
+def _get_cache_directory(*subdirs):
+    """Return a directory within the user's cache directory for signac-flow.
+
+    The directory is created if it does not exist yet.
+
+    :param subdirs:
+        The names of the subdirectories within the signac-flow cache directory.
+    :return:
+        The path to the directory or None if the directory is not writable.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    cache_dir = os.path.join(cache_home, 'signac-flow', *subdirs)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as error:
+        logger.debug("Unable to create cache directory: {}".format(error))
+        return None
+    if not os.access(cache_dir, os.W_OK):
+        return None
+    return cache_dir
+
+
 @contextmanager
 def add_path_to_environment_pythonpath(path):
     "Temporarily insert the current working directory into the environment PYTHONPATH variable."
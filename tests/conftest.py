@@ -0,0 +1,22 @@
+# Copyright (c) 2020 The Regents of the University of Michigan
+# All rights reserved.
+# This software is licensed under the BSD 3-Clause License.
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope='session')
+def cache_home(tmp_path_factory):
+    """Redirect the signac-flow cache directory to a temporary directory.
+
+    The template bytecode cache and the scheduler presence cache would otherwise
+    be written to the user's cache directory. Subprocesses inherit the setting.
+    """
+    previous = os.environ.get('XDG_CACHE_HOME')
+    os.environ['XDG_CACHE_HOME'] = str(tmp_path_factory.mktemp('cache'))
+    yield os.environ['XDG_CACHE_HOME']
+    if previous is None:
+        del os.environ['XDG_CACHE_HOME']
+    else:
+        os.environ['XDG_CACHE_HOME'] = previous
@@ -2,10 +2,14 @@
 # All rights reserved.
 # This software is licensed under the BSD 3-Clause License.
 import pytest
+from tempfile import TemporaryDirectory
 
+from flow import environment
 from flow import get_environment
 from flow.environment import ComputeEnvironment
+from flow.environment import SlurmEnvironment
 from flow.environment import TestEnvironment
+from flow.scheduling.slurm import SlurmScheduler
 from flow.errors import ConfigKeyError
 from test_project import StringIO, redirect_stdout
 
@@ -31,3 +35,50 @@ class TestProject():
 
         a = env.get_config_value('a', 42)
         assert a == 42
+
+    def test_scheduler_presence_cache(self, monkeypatch):
+        calls = []
+
+        def is_present():
+            calls.append(None)
+            return True
+
+        monkeypatch.setattr(SlurmScheduler, 'is_present', is_present)
+        monkeypatch.setattr(environment, '_SCHEDULER_PRESENCE', dict())
+        with TemporaryDirectory(prefix='signac-flow_') as tmp_dir:
+            monkeypatch.setenv('XDG_CACHE_HOME', tmp_dir)
+            assert SlurmEnvironment.is_present()
+            assert SlurmEnvironment.is_present()
+            assert len(calls) == 1
+
+            # The presence is cached persistently for the present host.
+            environment._SCHEDULER_PRESENCE.clear()
+            assert SlurmEnvironment.is_present()
+            assert len(calls) == 1
+
+            # The presence is determined again after an explicit refresh.
+            get_environment(refresh=True)
+            assert SlurmEnvironment.is_present()
+            assert len(calls) == 2
+
+    def test_scheduler_absence_cache_expiry(self, monkeypatch):
+        calls = []
+
+        def is_present():
+            calls.append(None)
+            return False
+
+        monkeypatch.setattr(SlurmScheduler, 'is_present', is_present)
+        monkeypatch.setattr(environment, '_SCHEDULER_PRESENCE', dict())
+        with TemporaryDirectory(prefix='signac-flow_') as tmp_dir:
+            monkeypatch.setenv('XDG_CACHE_HOME', tmp_dir)
+            assert not SlurmEnvironment.is_present()
+            environment._SCHEDULER_PRESENCE.clear()
+            assert not SlurmEnvironment.is_present()
+            assert len(calls) == 1
+
+            # The absence is determined again once the cached result has expired.
+            monkeypatch.setattr(environment, '_SCHEDULER_ABSENCE_EXPIRY', 0)
+            environment._SCHEDULER_PRESENCE.clear()
+            assert not SlurmEnvironment.is_present()
+            assert len(calls) == 2
@@ -7,12 +7,14 @@ import uuid
 import os
 import sys
 import inspect
+import json
 import subprocess
 import tempfile
 import collections.abc
 from contextlib import contextmanager, redirect_stdout, redirect_stderr
 from distutils.version import StrictVersion
 from io import StringIO
+from collections import Counter
 from itertools import groupby
 from tempfile import TemporaryDirectory
 from functools import partial
@@ -27,6 +29,7 @@ from flow.environment import ComputeEnvironment
 from flow.util.misc import add_path_to_environment_pythonpath
 from flow.util.misc import add_cwd_to_environment_pythonpath
 from flow.util.misc import switch_to_directory
+from flow.util.misc import to_hashable
 from flow import init
 from deprecation import fail_if_not_removed
 
@@ -185,6 +188,14 @@ class TestProjectStatusPerformance(TestProjectBase):
         assert time < 10
         MockScheduler.reset()
 
+    def test_lazy_imports(self):
+        """Ensure that importing flow does not import dependencies only needed on demand."""
+        lazy_modules = ['jinja2', 'tqdm', 'flow.util.mistune', 'flow.render_status']
+        code = "import sys, flow; print(','.join(m for m in {} if m in sys.modules))".format(
+            lazy_modules)
+        out = subprocess.check_output([sys.executable, '-c', code]).decode().strip()
+        assert out == ''
+
 
 class TestProjectClass(TestProjectBase):
 
@@ -282,6 +293,40 @@ class TestProjectClass(TestProjectBase):
         assert len(b._label_functions) == 2
         assert len(c._label_functions) == 1
 
+    def test_label_evaluation(self):
+
+        class A(FlowProject):
+
+            @flow.label()
+            def method_label(self, job):
+                calls['method_label'] += 1
+                return job.sp.i % 2 == 0
+
+        @A.label
+        def function_label(job):
+            calls['function_label'] += 1
+            return 'i={}'.format(job.sp.i)
+
+        calls = Counter()
+        project = A.get_project(root=self._tmp_dir.name)
+        for i in range(4):
+            project.open_job(dict(i=i)).init()
+        assert all(callable(func) for name, func in project._bound_label_functions)
+        assert [name for name, func in project._bound_label_functions] == \
+            ['method_label', 'function_label']
+        job = project.open_job(dict(i=0))
+        assert set(project.labels(job)) == {'method_label', 'i=0'}
+
+        # Every label is evaluated once per job within a single status pass.
+        calls.clear()
+        project.print_status(detailed=True, with_label='method_label', file=StringIO(),
+                             err=StringIO(), no_parallelize=True)
+        assert calls == {'method_label': 4, 'function_label': 4}
+        timings = project.label_timings()
+        assert set(timings) == {'method_label', 'function_label'}
+        assert all(num_calls == 4 and elapsed >= 0
+                   for num_calls, elapsed in timings.values())
+
     def test_conditions_with_inheritance(self):
         """Tests the inheritance of pre/post conditions.
 
@@ -474,6 +519,112 @@ class TestProjectClass(TestProjectBase):
             for next_op in project._next_operations(job):
                 assert next_op.directives['np'] == expected_np
 
+    def test_lazy_directives_resolution(self):
+
+        class A(FlowProject):
+            pass
+
+        evaluated = []
+
+        def walltime(job):
+            evaluated.append(job)
+            return 1
+
+        @A.operation
+        @directives(walltime=walltime, nranks=2, memory='{job.sp.a}g')
+        def a(job):
+            return 'hello!'
+
+        project = self.mock_project(A)
+        group = project.groups['a']
+        default_directives = project._get_default_directives()
+        for job in project:
+            submission_directives = group._get_submission_directives(default_directives, job)
+            assert submission_directives['np'] == submission_directives['nranks'] == 2
+        assert not evaluated
+        resolver = group._get_directives_resolver('a', default_directives)
+        for job in project:
+            next_op = list(project._next_operations(job))[0]
+            assert next_op.directives['memory'] == '{}g'.format(job.sp.a)
+            assert 'walltime' in next_op.directives
+        assert not evaluated
+        for job in project:
+            next_op = list(project._next_operations(job))[0]
+            assert next_op.directives['walltime'] == next_op.directives['walltime'] == 1
+        assert len(evaluated) == len(project)
+        assert group._get_directives_resolver('a', default_directives) is resolver
+
+        # Tracking the usage of the directives does not evaluate them.
+        del evaluated[:]
+        ops = [list(project._next_operations(job))[0] for job in project]
+        with flow.project._track_directives_usage(ops) as keys_unused:
+            assert ops[0].directives['memory'] == '{}g'.format(ops[0].job.sp.a)
+        assert not evaluated
+        assert 'walltime' in keys_unused and 'memory' in keys_unused
+        with flow.project._track_directives_usage(ops) as keys_unused:
+            for op in ops:
+                assert op.directives.get('memory') == '{}g'.format(op.job.sp.a)
+        assert not evaluated
+        assert 'memory' not in keys_unused
+
+    def test_submission_conditions_evaluated_once(self):
+
+        class A(FlowProject):
+            pass
+
+        evaluated = []
+
+        def condition(value):
+            def _condition(job):
+                evaluated.append(job)
+                return value
+            return _condition
+
+        group = A.make_group('ab')
+
+        @group
+        @A.operation
+        @A.pre(condition(True))
+        @A.post(condition(False))
+        def eligible_op(job):
+            pass
+
+        @group
+        @A.operation
+        @A.pre(condition(False))
+        @A.post(condition(False))
+        def unmet_pre_op(job):
+            pass
+
+        @group
+        @A.operation
+        @A.pre(condition(True))
+        @A.post(condition(True))
+        def met_post_op(job):
+            pass
+
+        project = self.mock_project(A)
+        for job in project:
+            del evaluated[:]
+            job_op = project.groups['ab']._create_submission_job_operation(
+                project._entrypoint, dict(), job)
+            assert len(evaluated) == 6
+            assert [op.name for op in job_op.eligible_operations] == ['eligible_op']
+            assert [op.name for op in job_op.operations_with_unmet_preconditions] == \
+                ['unmet_pre_op']
+            assert [op.name for op in job_op.operations_with_met_postconditions] == \
+                ['met_post_op']
+
+        # The eligibility of the group is determined with the same evaluation.
+        del evaluated[:]
+        job_ops = list(project._get_submission_operations(project, dict(), names=['ab']))
+        assert len(job_ops) == len(project)
+        assert len(evaluated) == 6 * len(project)
+        del evaluated[:]
+        with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+            project.submit(names=['ab'], pretend=True)
+        assert len(evaluated) == 6 * len(project)
+
     def test_copy_conditions(self):
 
         class A(FlowProject):
@@ -603,6 +754,17 @@ class TestProject(TestProjectBase):
                     assert op.name == ['op2', 'op3'][i]
             assert i == 2 if job in even_jobs else 1
 
+    def test_lazy_job_operations(self):
+        project = self.mock_project()
+        for job in project:
+            for op in project._next_operations(job):
+                assert not hasattr(op, '__dict__')
+                assert callable(op._cmd) and callable(op._directives)
+                assert op.directives['np'] == op.directives.get('np')
+                assert not callable(op._directives)
+                assert isinstance(op.cmd, str)
+                assert not callable(op._cmd)
+
     def test_get_job_status(self):
         project = self.mock_project()
         for job in project:
@@ -656,6 +818,221 @@ class TestProject(TestProjectBase):
                 with redirect_stderr(StringIO()):
                     project.print_status(parameters=parameters, detailed=True)
 
+    def test_project_status_varying_parameters(self):
+        project = self.mock_project(heterogeneous=True)
+        varying = {key for job in project for key in job.sp.keys()
+                   if len({to_hashable(job.sp().get(key)) for job in project}) > 1}
+        status = StringIO()
+        with redirect_stderr(StringIO()):
+            project.print_status(file=status, output_format='markdown', detailed=True,
+                                 parameters=project.PRINT_STATUS_ALL_VARYING_PARAMETERS)
+        header = next(line for line in status.getvalue().splitlines()
+                      if line.startswith('| job_id'))
+        assert header == '| job_id | operation | {} | labels |'.format(
+            ' | '.join(sorted(varying)))
+
+    def test_project_status_page(self):
+        project = self.mock_project()
+
+        def page(**kwargs):
+            status = StringIO()
+            with redirect_stderr(StringIO()):
+                project.print_status(file=status, dump_json=True, **kwargs)
+            return list(json.loads(status.getvalue()))
+
+        job_ids = sorted(str(job) for job in project)
+        even_ids = [str(job) for job in sorted(project, key=str) if job.sp.b % 2 == 0]
+        assert page(sort_by='job_id', offset=2, limit=3) == job_ids[2:5]
+        assert page(sort_by='job_id', offset=len(job_ids)) == []
+        assert page(sort_by='job_id', with_eligible_operation='op1') == even_ids
+        assert page(sort_by='job_id', with_label='b_is_even', limit=2) == even_ids[:2]
+        b_values = [project.open_job(id=job_id).sp.b for job_id in page(sort_by='b')]
+        assert b_values == sorted(b_values)
+        with pytest.raises(ValueError):
+            page(with_eligible_operation='does_not_exist')
+
+    def test_project_status_json_lines(self):
+        project = self.mock_project()
+        for only_incomplete in (False, True):
+            status = StringIO()
+            with redirect_stderr(StringIO()):
+                project.print_status(file=status, output_format='jsonl',
+                                     only_incomplete=only_incomplete)
+            lines = status.getvalue().splitlines()
+            if not only_incomplete:
+                assert len(lines) == len(project)
+            for line in lines:
+                job_status = json.loads(line)
+                expected = project.get_job_status(project.open_job(id=job_status['job_id']))
+                assert job_status == json.loads(json.dumps(expected))
+
+    def test_export_job_statuses(self):
+        project = self.mock_project()
+        job_ids = {str(job) for job in project}
+        with signac.Collection() as collection:
+            with redirect_stderr(StringIO()):
+                project.export_job_statuses(collection, batch_size=3, incremental=True)
+            assert set(collection.ids) == job_ids
+            doc = collection.find_one({'_id': min(job_ids)})
+            assert doc['statepoint'] == project.open_job(id=doc['_id']).statepoint()
+            collection.replace_one({'_id': doc['_id']}, dict(doc, marker=True))
+
+            # Unchanged statuses are not exported again in incremental mode.
+            with redirect_stderr(StringIO()):
+                project.export_job_statuses(collection, batch_size=3, incremental=True)
+            assert collection.find_one({'_id': doc['_id']})['marker']
+            with redirect_stderr(StringIO()):
+                project.export_job_statuses(collection, batch_size=None)
+            assert 'marker' not in collection.find_one({'_id': doc['_id']})
+
+    def test_export_job_statuses_update_one(self):
+
+        class Collection:
+            "A collection that only supports upserts with update_one and $set."
+
+            def __init__(self):
+                self.docs = dict()
+                self.num_updates = 0
+
+            def find_one(self, filter):
+                return self.docs.get(filter['_id'])
+
+            def update_one(self, filter, update, upsert=False):
+                self.num_updates += 1
+                self.docs.setdefault(filter['_id'], dict(filter)).update(update['$set'])
+
+        project = self.mock_project()
+        job = next(iter(project))
+        status = project.get_job_status(job)
+        collection = Collection()
+        for labels, incremental in ((['A'], True), (['B'], False), (['A'], True)):
+            project.export_job_statuses(
+                collection, [dict(status, labels=labels)], incremental=incremental)
+            assert collection.find_one({'_id': str(job)})['labels'] == labels
+
+        # The statuses are not modified, such that they can be exported again.
+        statuses = [dict(status, labels=['A'])]
+        num_updates = collection.num_updates
+        for i in range(2):
+            project.export_job_statuses(collection, statuses, incremental=True)
+        assert statuses == [dict(status, labels=['A'])]
+        assert collection.num_updates == num_updates
+
+    def test_collect_stats(self):
+        project = self.mock_project()
+        with flow.collect_stats() as stats:
+            with redirect_stderr(StringIO()):
+                project.print_status(detailed=True, file=StringIO())
+                with add_cwd_to_environment_pythonpath():
+                    with switch_to_directory(project.root_directory()):
+                        project.run(names=['op1'])
+        result = json.loads(json.dumps(stats.to_dict()))
+        assert list(result) == list(stats.CATEGORIES)
+        assert result['labels']['default_label']['count'] == len(project)
+        assert result['template_renders']['status.jinja']['count'] == 1
+        assert result['operations']['op1']['count'] == \
+            len([job for job in project if job.sp.b % 2 == 0])
+        assert result['conditions'] and result['id_generations']
+        assert all(event['time'] >= 0
+                   for events in result.values() for event in events.values())
+
+        # Events outside of the context are not recorded.
+        with redirect_stderr(StringIO()):
+            project.print_status(file=StringIO())
+        assert json.loads(json.dumps(stats.to_dict())) == result
+
+    def test_project_status_overview_only(self):
+        project = self.mock_project()
+        for only_incomplete in (False, True):
+            overview, full = StringIO(), StringIO()
+            with redirect_stderr(StringIO()):
+                project.print_status(file=overview, output_format='markdown',
+                                     only_incomplete=only_incomplete)
+                project.print_status(file=full, output_format='markdown', detailed=True,
+                                     only_incomplete=only_incomplete)
+            overview = overview.getvalue().strip()
+            assert 'Total # of jobs' in overview
+            assert full.getvalue().strip().startswith(overview)
+
+    def test_project_status_overview_custom_template(self):
+        project = self.mock_project()
+        os.makedirs(project._template_dir, exist_ok=True)
+        with open(os.path.join(project._template_dir, 'job_ids.txt'), 'w') as file:
+            file.write("{% for job in jobs %}{{ job.job_id }}\n{% endfor %}")
+        out = StringIO()
+        with redirect_stderr(StringIO()):
+            project.print_status(file=out, template='job_ids.txt')
+        assert out.getvalue().split() == [job.get_id() for job in project]
+
+    def test_project_status_columnar(self):
+        pytest.importorskip('numpy')
+        project = self.mock_project()
+        for kwargs in (dict(detailed=True, parameters=['a']),
+                       dict(detailed=True, only_incomplete=True, all_ops=True),
+                       dict(detailed=True, unroll=False),
+                       dict(dump_json=True)):
+            expected, columnar = StringIO(), StringIO()
+            with redirect_stderr(StringIO()):
+                project.print_status(file=expected, **kwargs)
+                project.print_status(file=columnar, columnar=True, **kwargs)
+            assert columnar.getvalue() == expected.getvalue()
+
+        from flow.status import _ColumnarStatus
+        with redirect_stderr(StringIO()):
+            statuses = list(project._fetch_status(project, StringIO(), ignore_errors=False))
+        for row, status in zip(_ColumnarStatus(statuses, sorted(project.operations)), statuses):
+            assert row.to_dict() == status
+            assert row['operations'] is row['operations']
+
+    def test_project_status_terminal_tables(self):
+        from flow.render_status import Renderer
+        from flow.util import mistune
+        project = self.mock_project(heterogeneous=True)
+        for kwargs in (dict(), dict(parameters=True), dict(unroll=False, pretty=True)):
+            markdown = StringIO()
+            with redirect_stderr(StringIO()):
+                project.print_status(file=markdown, output_format='markdown',
+                                     detailed=True, **kwargs)
+            renderer = Renderer()
+            renderer.markdown_output = markdown.getvalue()
+            assert renderer.generate_terminal_output() == mistune.terminal(
+                markdown.getvalue())
+
+    def test_format_table(self):
+        from flow.render_status import _format_table
+        from flow.util.mistune.plugins.tabulate import tabulate
+        headers = ['job id', 'n', 'flag', 'labels']
+        for rows in ([['\x1b[1mabc\x1b[0m', '12', 'True', 'a, b'], ['de', '3', 'False']],
+                     [['abc', '1'], ['a-very-long-job-id', '-100']],
+                     [['abc', '1.5', 'True', 'x']],
+                     [['abc', '1', 'True', 'x', 'extra']],
+                     []):
+            assert '\n'.join(_format_table(headers, rows)) == tabulate(rows, headers=headers)
+
+    def test_project_status_stream(self):
+        project = self.mock_project()
+        for output_format in ('terminal', 'markdown'):
+            expected = StringIO()
+            with redirect_stderr(StringIO()):
+                project.print_status(parameters=['a'], detailed=True, file=expected,
+                                     output_format=output_format)
+            streamed = StringIO()
+            with redirect_stderr(StringIO()):
+                project.print_status(parameters=['a'], detailed=True, file=streamed,
+                                     output_format=output_format, stream=True)
+            output = streamed.getvalue()
+            for job in project:
+                assert str(job) in output
+            assert 'Total # of jobs: {}'.format(len(project)) in output
+            assert output.index('Detailed View') < output.index('Overview')
+            for line in expected.getvalue().splitlines():
+                if line.startswith('Total'):
+                    assert line.strip() in output
+        with pytest.raises(ValueError):
+            with redirect_stderr(StringIO()):
+                project.print_status(detailed=True, file=StringIO(),
+                                     output_format='html', stream=True)
+
     def test_script(self):
         project = self.mock_project()
         for job in project:
@@ -690,6 +1067,18 @@ class TestProject(TestProjectBase):
                 assert 'echo "hello"' not in script
                 assert 'exec op2' in script
 
+    def test_template_environment_cache(self, monkeypatch):
+        cache_home = os.path.join(self._tmp_dir.name, 'cache')
+        monkeypatch.setenv('XDG_CACHE_HOME', cache_home)
+        project = self.mock_project()
+        template_environment = project._template_environment()
+        assert self.mock_project()._template_environment() is template_environment
+        job = next(iter(project))
+        script = project._script(project._next_operations(job))
+        assert str(job) in script
+        cache_dir = os.path.join(cache_home, 'signac-flow', 'templates')
+        assert any(fn.startswith('__signac_flow_') for fn in os.listdir(cache_dir))
+
     def test_init(self):
         with open(os.devnull, 'w') as out:
             for fn in init(root=self._tmp_dir.name, out=out):
@@ -754,7 +1143,7 @@ class TestExecutionProject(TestProjectBase):
         def sort_key(op):
             return op.name, op.job.get_id()
 
-        for order in (None, 'none', 'cyclic', 'by-job', 'random', sort_key):
+        for order in (None, 'none', 'cyclic', 'by-job', 'random', 'pipeline', sort_key):
             for job in self.project.find_jobs():  # clear
                 job.remove()
             with subtests.test(order=order):
@@ -827,6 +1216,21 @@ class TestExecutionProject(TestProjectBase):
             else:
                 assert not job.isfile('world.txt')
 
+    def test_run_parallel_pipeline(self):
+        project = self.mock_project()
+        output = StringIO()
+        with add_cwd_to_environment_pythonpath():
+            with switch_to_directory(project.root_directory()):
+                with redirect_stderr(output):
+                    project.run(np=2, order='pipeline')
+        even_jobs = [job for job in project if job.sp.b % 2 == 0]
+        for job in project:
+            assert 'test' in job.doc
+            if job in even_jobs:
+                assert job.isfile('world.txt')
+            else:
+                assert not job.isfile('world.txt')
+
     def test_run_condition_inheritance(self):
 
         # This assignment is necessary to use the `mock_project` function on
@@ -916,6 +1320,19 @@ class TestExecutionProject(TestProjectBase):
             project._submit_operations(_id=cluster_job_id, operations=operations)
         assert len(list(MockScheduler.jobs())) == 1
 
+    def test_generate_submit_scripts(self):
+        project = self.mock_project()
+        bundles = [(project._store_bundled([op]), [op])
+                   for op in project._get_submission_operations(
+                       project, project._get_default_directives())]
+        scripts = project._generate_submit_scripts(
+            bundles, template='script.sh', show_template_help=False, env=project._environment)
+        for (_id, operations), script in zip(bundles, scripts):
+            assert script == project._generate_submit_script(
+                _id, operations, template='script.sh', show_template_help=False,
+                env=project._environment)
+            assert 'run -o {} -j {}'.format(operations[0].name, operations[0].job) in script
+
     def test_submit(self):
         MockScheduler.reset()
         project = self.mock_project()
@@ -946,6 +1363,71 @@ class TestExecutionProject(TestProjectBase):
             project.submit(num=1)
         assert len(list(MockScheduler.jobs())) == 2
 
+    def test_submit_work_queue(self):
+        MockScheduler.reset()
+        project = self.mock_project()
+        job = project.open_job(dict(a=0, b=0))
+        with redirect_stderr(StringIO()):
+            project.submit(jobs=[job], names=['op1', 'op2'], num_workers=2)
+        assert len(list(MockScheduler.jobs())) == 2
+        scripts = list(MockScheduler._scripts.values())[-2:]
+        assert all(' worker ' in script for script in scripts)
+        assert all('run -o op1' not in script for script in scripts)
+        with suspend_logging():
+            for i in range(3):
+                MockScheduler.step()
+        assert job.isfile('world.txt')
+        assert 'test' in job.doc
+        # The queue is removed once it is drained.
+        assert not os.path.exists(os.path.join(project.root_directory(), '.work_queue'))
+
+    def test_work_queue_failed_operation(self):
+        project = self.mock_project()
+        job = next(iter(project))
+        operations = [
+            flow.project._JobOperation(name, name, job, cmd=cmd)
+            for name, cmd in (('fail', 'exit 1'), ('touch', 'touch touched.txt'))]
+        queue_id = project._enqueue_operations(operations)
+        fn_queue = project._fn_work_queue(queue_id)
+        with switch_to_directory(project.root_directory()):
+            with suspend_logging():
+                assert project._run_work_queue(queue_id) == 1
+            assert os.path.isfile('touched.txt')
+        # The failed entry is kept aside instead of being claimed again.
+        assert project._claim_queued_operation(queue_id) is None
+        assert len(os.listdir(os.path.join(fn_queue, '.failed'))) == 1
+        assert not os.path.exists(os.path.join(fn_queue, '.claimed'))
+
+    def test_submit_collapse(self):
+        MockScheduler.reset()
+        project = self.mock_project()
+        with redirect_stderr(StringIO()):
+            project.submit(bundle_size=0, names=['op1', 'op2'], collapse=True)
+        assert len(list(MockScheduler.jobs())) == 1
+        script = list(MockScheduler._scripts.values())[-1]
+        assert script.count('run -o op2 -j') == 1
+        with suspend_logging():
+            for i in range(3):
+                MockScheduler.step()
+        for job in project:
+            assert 'test' in job.doc
+            assert job.isfile('world.txt') == (job.sp.b % 2 == 0)
+
+    def test_submit_collapse_directives_usage(self, caplog):
+        project = self.mock_project()
+        warnings = dict()
+        for collapse in (False, True):
+            caplog.clear()
+            script = StringIO()
+            with redirect_stdout(script), redirect_stderr(StringIO()):
+                project.submit(bundle_size=0, names=['op1', 'op2'], collapse=collapse,
+                               pretend=True)
+            assert (script.getvalue().count('run -o op2 -j') == 1) == collapse
+            warnings[collapse] = [record.getMessage() for record in caplog.records
+                                  if 'not used by the template' in record.getMessage()]
+        # The directives of collapsed operations are used like those of the others.
+        assert warnings[True] == warnings[False]
+
     def test_resubmit(self):
         MockScheduler.reset()
         project = self.mock_project()
@@ -1017,6 +1499,26 @@ class TestExecutionProject(TestProjectBase):
                 assert job_status['operations'][op]['scheduler_status'] in \
                     (JobStatus.unknown, JobStatus.inactive)
 
+    def test_submit_status_poller(self):
+        MockScheduler.reset()
+        project = self.mock_project()
+        with redirect_stderr(StringIO()):
+            project.submit()
+        MockScheduler.step()
+        MockScheduler.step()
+
+        with project.poll_scheduler_status(interval=0.1) as poller:
+            assert poller is not None and poller.is_alive()
+            with pytest.raises(RuntimeError):
+                with project.poll_scheduler_status():
+                    pass
+            project._fetch_scheduler_status(file=StringIO())
+            for job in project:
+                next_op = list(project._next_operations(job))[0]
+                assert next_op.get_status() == JobStatus.queued
+        assert not poller.is_alive()
+        assert project._scheduler_status_poller is None
+
     def test_submit_operations_bad_directive(self):
         MockScheduler.reset()
         project = self.mock_project()
@@ -1032,6 +1534,17 @@ class TestExecutionProject(TestProjectBase):
         assert 'Some of the keys provided as part of the directives were not used by the template '
         'script, including: bad_directive\n' in stderr.getvalue()
 
+    def test_unused_directives_per_operation(self):
+        project = self.mock_project()
+        job = next(iter(project))
+        ops = [flow.project._JobOperation(name, name, job, cmd='true',
+                                          directives=dict(walltime=1))
+               for name in ('a', 'b')]
+        with flow.project._track_directives_usage(ops) as keys_unused:
+            assert ops[0].directives['walltime'] == 1
+        assert keys_unused == {'walltime'}
+        assert ops[1].directives == dict(walltime=1)
+
     @fail_if_not_removed
     def test_condition_evaluation(self):
         project = self.mock_project()
@@ -1145,6 +1658,32 @@ class TestProjectMainInterface(TestProjectBase):
         for job in self.project:
             assert job.doc.get('test', False)
 
+    def test_main_exec_fast_path(self, monkeypatch):
+        job = next(iter(self.project))
+        project = self.project_class.get_project(root=self._tmp_dir.name)
+        assert project._parse_exec_args(['exec', 'op2', '--debug', job.get_id()]) is None
+        assert project._parse_exec_args(['exec', 'no_such_op', job.get_id()]) is None
+        monkeypatch.setattr(sys, 'argv', ['project.py', 'exec', 'op2', job.get_id()])
+        project.main()
+        assert job.doc.get('test', False)
+        # The compute environment is not detected for the execution of operations.
+        assert project._environment_ is None
+
+    def test_main_status_page_errors(self, monkeypatch):
+        project = self.project_class.get_project(root=self._tmp_dir.name)
+        for args, code, message in (
+                (['--with-eligible', 'does_not_exist'], 1,
+                 "Unknown operation or group 'does_not_exist'"),
+                (['--offset=-1'], 2, "Value must not be negative")):
+            monkeypatch.setattr(sys, 'argv', ['project.py', 'status'] + args)
+            err = StringIO()
+            with redirect_stderr(err):
+                with pytest.raises(SystemExit) as exit_info:
+                    project.main()
+            assert exit_info.value.code == code
+            assert message in err.getvalue()
+            assert 'Traceback' not in err.getvalue()
+
     def test_main_run(self):
         assert len(self.project)
         for job in self.project:
@@ -1214,6 +1753,110 @@ class TestProjectDagDetection(TestProjectBase):
                        [0, 0, 0, 0, 0, 0, 0]]
 
         assert adj == adj_correct
+        assert project._get_operation_graph() is project._get_operation_graph()
+        assert project._get_operation_graph().upstream['seventh'] == {'third', 'fourth'}
+
+    def test_run_target(self):
+        project = self.mock_project()
+        job = project.open_job(dict(a=0, b=0))
+        with pytest.raises(ValueError):
+            project.run(jobs=[job], names=['first'], target='fourth')
+        project.run(jobs=[job], target='fourth')
+        assert all(job.doc.get(key) for key in ('first', 'second', 'third', 'fourth'))
+        assert 'seventh' not in job.doc
+        assert not job.isfile('fifth.txt')
+
+    def test_run_target_complete(self):
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @A.post.true('upstream')
+        def upstream(job):
+            job.doc.upstream = True
+
+        @A.operation
+        @A.pre.after(upstream)
+        @A.post.true('target')
+        def target(job):
+            job.doc.target = True
+
+        project = self.mock_project(A)
+        complete = project.open_job(dict(a=0, b=0))
+        pending = project.open_job(dict(a=1, b=0))
+        complete.doc.target = True
+        for order in (None, 'pipeline'):
+            complete.doc.pop('upstream', None)
+            pending.doc.clear()
+            project.run(jobs=[complete, pending], target='target', order=order)
+            assert 'upstream' not in complete.doc
+            assert pending.doc.upstream and pending.doc.target
+
+    def test_run_pipeline(self):
+        project = self.mock_project()
+        project.run(order='pipeline')
+        for job in project:
+            assert all(job.doc.get(key) for key in
+                       ('first', 'second', 'third', 'fourth', 'sixth', 'seventh'))
+            assert job.isfile('fifth.txt')
+
+    def test_run_topological_order(self):
+
+        class A(FlowProject):
+            pass
+
+        def x_is_set(job):
+            return job.doc.get('x', False)
+
+        @A.operation
+        @A.pre(x_is_set)
+        @A.post.true('downstream')
+        def downstream(job):
+            job.doc.executed = job.doc.get('executed', []) + ['downstream']
+            job.doc.downstream = True
+
+        @A.operation
+        @A.post(x_is_set)
+        @A.post.true('upstream')
+        def upstream(job):
+            job.doc.executed = job.doc.get('executed', []) + ['upstream']
+            job.doc.upstream = True
+
+        project = self.mock_project(A)
+        job = project.open_job(dict(a=0, b=0))
+        job.doc.x = True
+        project.run(jobs=[job])
+        assert job.doc.executed == ['upstream', 'downstream']
+
+    def test_bytecode_identical_conditions(self):
+
+        class A(FlowProject):
+            pass
+
+        def file_exists(filename):
+            return lambda job: job.isfile(filename)
+
+        @A.operation
+        @A.post(lambda job: job.isfile('a'))
+        @A.post(file_exists('c'))
+        def op1(job):
+            pass
+
+        @A.operation
+        @A.pre(lambda job: job.isfile('b'))
+        @A.pre(file_exists('d'))
+        def op2(job):
+            pass
+
+        @A.operation
+        @A.pre(file_exists('c'))
+        def op3(job):
+            pass
+
+        project = self.mock_project(A)
+        assert project.detect_operation_graph() == [[0, 0, 1], [0, 0, 0], [0, 0, 0]]
+        assert project._get_operation_graph().upstream['op2'] == set()
 
 
 # Tests for multiple operation groups or groups with options
@@ -1252,6 +1895,19 @@ class TestGroupProject(TestProjectBase):
             script2 = project._script([job_op2])
             assert '--num-passes=2' in script2
 
+    def test_script_collapse(self):
+        project = self.mock_project()
+        job_ops = list(project._get_submission_operations(project, dict(), names=['op1', 'op2']))
+        even_jobs = [job for job in project if job.sp.b % 2 == 0]
+        script = project._script(job_ops, collapse=True)
+        assert script.count('run -o op1 -j') == 1
+        assert script.count('run -o op2 -j') == 1
+        assert 'run -o op1 -j {}\n'.format(' '.join(map(str, even_jobs))) in script
+        assert 'run -o op2 -j {}\n'.format(' '.join(map(str, project))) in script
+        # Operations executed in parallel are not collapsed.
+        script = project._script(job_ops, parallel=True, collapse=True)
+        assert script.count('run -o op2 -j') == len(project)
+
     def test_directives_hierarchy(self):
         project = self.mock_project()
         for job in project: